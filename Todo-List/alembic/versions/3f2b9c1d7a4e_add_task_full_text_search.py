@@ -0,0 +1,68 @@
+"""Add task full-text search
+
+Revision ID: 3f2b9c1d7a4e
+Revises: cda5ddf932c6
+Create Date: 2026-10-18 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2b9c1d7a4e'
+down_revision: Union[str, None] = 'cda5ddf932c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+POSTGRESQL_UPGRADE = [
+    "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))) STORED",
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)",
+]
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_tasks_search_vector",
+    "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def upgrade() -> None:
+    # B-tree indexes on free text never serve a search and only slow down writes
+    op.execute("DROP INDEX IF EXISTS ix_tasks_title")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_description")
+
+    dialect = op.get_context().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRESQL_UPGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_context().dialect.name
+    statements = {"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRESQL_DOWNGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+    op.create_index(op.f('ix_tasks_description'), 'tasks', ['description'], unique=False)
+    op.create_index(op.f('ix_tasks_title'), 'tasks', ['title'], unique=False)
@@ -0,0 +1,34 @@
+"""Index live categories in board order
+
+Revision ID: 5d1f8b3e9c27
+Revises: e2b7c4d9f813
+Create Date: 2026-10-18 19:42:10.513086
+
+Board, summary, export and keyset page reads filter on deleted_at IS NULL and
+order by (category_order, id). Until ANALYZE has run, SQLite reads that filter
+from ix_categories_deleted_at and sorts every live category in a temporary
+b-tree, so a keyset page costs as much as the whole table. An index led by
+deleted_at serves the filter and the order together. ix_categories_deleted_at
+stays for the hidden-categories lookup and for the offset list, which reads
+live categories in id order.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f8b3e9c27'
+down_revision: Union[str, None] = 'e2b7c4d9f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_categories_deleted_at_category_order_id', 'categories',
+                    ['deleted_at', 'category_order', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_categories_deleted_at_category_order_id', table_name='categories')
@@ -0,0 +1,45 @@
+"""Composite board indexes
+
+Revision ID: 7c1e4a9b2d60
+Revises: 3f2b9c1d7a4e
+Create Date: 2026-10-18 14:05:37.902114
+
+Every task query filters on category_id and orders by task_order, but only
+task_order was indexed, so reading one category scanned the whole table.
+Categories are read in (category_order, id) order for the board and keyset pages.
+
+The id indexes duplicate the primary keys, and nothing filters or sorts on
+categories.name or on task_order across categories, so those indexes only cost
+writes and are dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a9b2d60'
+down_revision: Union[str, None] = '3f2b9c1d7a4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_category_id_task_order', 'tasks', ['category_id', 'task_order'], unique=False)
+    op.create_index('ix_categories_category_order_id', 'categories', ['category_order', 'id'], unique=False)
+    op.drop_index('ix_tasks_task_order', table_name='tasks')
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_categories_category_order', table_name='categories')
+    op.drop_index('ix_categories_name', table_name='categories')
+    op.drop_index('ix_categories_id', table_name='categories')
+
+
+def downgrade() -> None:
+    op.create_index('ix_categories_id', 'categories', ['id'], unique=False)
+    op.create_index('ix_categories_name', 'categories', ['name'], unique=False)
+    op.create_index('ix_categories_category_order', 'categories', ['category_order'], unique=False)
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+    op.create_index('ix_tasks_task_order', 'tasks', ['task_order'], unique=False)
+    op.drop_index('ix_categories_category_order_id', table_name='categories')
+    op.drop_index('ix_tasks_category_id_task_order', table_name='tasks')
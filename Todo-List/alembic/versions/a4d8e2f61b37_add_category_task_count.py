@@ -0,0 +1,80 @@
+"""Add category task_count
+
+Revision ID: a4d8e2f61b37
+Revises: 7c1e4a9b2d60
+Create Date: 2026-10-18 16:21:09.334871
+
+A per-category task counter for GET /v1/categories/summary, so column counts
+cost one row per category instead of a pass over every task. Triggers keep it
+in step with every insert, delete and move between categories, whichever code
+path issues them. Other dialects get the column but no triggers, and the app
+counts with GROUP BY there instead.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e2f61b37'
+down_revision: Union[str, None] = '7c1e4a9b2d60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE TRIGGER tasks_count_ai AFTER INSERT ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+    "CREATE TRIGGER tasks_count_ad AFTER DELETE ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; END",
+    "CREATE TRIGGER tasks_count_au AFTER UPDATE OF category_id ON tasks "
+    "WHEN old.category_id IS NOT new.category_id BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_count_au",
+    "DROP TRIGGER IF EXISTS tasks_count_ad",
+    "DROP TRIGGER IF EXISTS tasks_count_ai",
+]
+POSTGRESQL_UPGRADE = [
+    "CREATE OR REPLACE FUNCTION tasks_count_sync() RETURNS trigger AS $$ BEGIN "
+    "IF TG_OP IN ('DELETE', 'UPDATE') THEN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = OLD.category_id; END IF; "
+    "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = NEW.category_id; END IF; "
+    "RETURN NULL; END $$ LANGUAGE plpgsql",
+    "CREATE TRIGGER tasks_count_insert_delete AFTER INSERT OR DELETE ON tasks "
+    "FOR EACH ROW EXECUTE FUNCTION tasks_count_sync()",
+    "CREATE TRIGGER tasks_count_move AFTER UPDATE OF category_id ON tasks "
+    "FOR EACH ROW WHEN (OLD.category_id IS DISTINCT FROM NEW.category_id) EXECUTE FUNCTION tasks_count_sync()",
+]
+POSTGRESQL_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_count_move ON tasks",
+    "DROP TRIGGER IF EXISTS tasks_count_insert_delete ON tasks",
+    "DROP FUNCTION IF EXISTS tasks_count_sync()",
+]
+
+
+def upgrade() -> None:
+    op.add_column('categories', sa.Column('task_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE categories SET task_count = "
+        "(SELECT count(*) FROM tasks WHERE tasks.category_id = categories.id)"
+    )
+
+    dialect = op.get_context().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRESQL_UPGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_context().dialect.name
+    statements = {"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRESQL_DOWNGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.drop_column('task_count')
@@ -1,7 +1,7 @@
 """Add category_order to categories
 
 Revision ID: c366226711e7
-Revises: 
+Revises: 0b5e1c2d3a4f
 Create Date: 2024-07-31 00:34:24.048374
 
 """
@@ -13,7 +13,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = 'c366226711e7'
-down_revision: Union[str, None] = None
+down_revision: Union[str, None] = '0b5e1c2d3a4f'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -20,7 +20,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column('categories', 'category_order',
+    # Batch mode so SQLite, which has no ALTER COLUMN, rebuilds the table instead
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.alter_column('category_order',
                existing_type=sa.INTEGER(),
                nullable=False)
     # ### end Alembic commands ###
@@ -28,7 +30,9 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column('categories', 'category_order',
+    # Batch mode so SQLite, which has no ALTER COLUMN, rebuilds the table instead
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.alter_column('category_order',
                existing_type=sa.INTEGER(),
                nullable=True)
     # ### end Alembic commands ###
@@ -0,0 +1,89 @@
+"""Cascade category deletes in the database
+
+Revision ID: e2b7c4d9f813
+Revises: a4d8e2f61b37
+Create Date: 2026-10-18 17:05:52.118406
+
+tasks.category_id gets ON DELETE CASCADE, so deleting a category is a single
+DELETE and the database removes its tasks without sending them to the app.
+categories.deleted_at marks categories hidden by a soft delete whose tasks are
+still being purged in batches. Its index serves the "which categories are
+hidden" lookup that task reads make. A partial index (WHERE deleted_at IS NOT
+NULL) would be smaller, but with it SQLite stopped reading small categories
+tables in id order and sorted them instead.
+
+SQLite cannot alter a foreign key, so tasks is rebuilt. Triggers belong to the
+old table and go with it, and the full-text search and task_count triggers are
+created again afterwards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4d9f813'
+down_revision: Union[str, None] = 'a4d8e2f61b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The baseline created this foreign key without a name; batch reflection names it by this convention
+SQLITE_NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+SQLITE_FK_NAME = "fk_tasks_category_id_categories"
+# PostgreSQL's default name for the same constraint
+POSTGRESQL_FK_NAME = "tasks_category_id_fkey"
+
+# Revisions 3f2b9c1d7a4e and a4d8e2f61b37, dropped with the old tasks table on SQLite
+SQLITE_TASK_TRIGGERS = [
+    "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_count_ai AFTER INSERT ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+    "CREATE TRIGGER tasks_count_ad AFTER DELETE ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; END",
+    "CREATE TRIGGER tasks_count_au AFTER UPDATE OF category_id ON tasks "
+    "WHEN old.category_id IS NOT new.category_id BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+]
+
+
+def _replace_category_fk(ondelete) -> None:
+    if op.get_context().dialect.name == "sqlite":
+        with op.batch_alter_table('tasks', recreate='always', naming_convention=SQLITE_NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(SQLITE_FK_NAME, type_='foreignkey')
+            batch_op.create_foreign_key(SQLITE_FK_NAME, 'categories', ['category_id'], ['id'], ondelete=ondelete)
+    else:
+        op.drop_constraint(POSTGRESQL_FK_NAME, 'tasks', type_='foreignkey')
+        op.create_foreign_key(POSTGRESQL_FK_NAME, 'tasks', 'categories', ['category_id'], ['id'], ondelete=ondelete)
+
+
+def _restore_task_triggers() -> None:
+    if op.get_context().dialect.name == "sqlite":
+        for statement in SQLITE_TASK_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    _replace_category_fk('CASCADE')
+    _restore_task_triggers()
+
+    op.add_column('categories', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_categories_deleted_at', 'categories', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_categories_deleted_at', table_name='categories')
+    # Rebuilding tasks first drops the task_count triggers, which would otherwise stop
+    # SQLite from renaming the rebuilt categories table into place
+    _replace_category_fk(None)
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.drop_column('deleted_at')
+    _restore_task_triggers()
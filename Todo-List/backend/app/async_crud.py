@@ -0,0 +1,266 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+from .models import Category, Task
+from .crud import LIVE_TASK, TASK_COUNT_DIALECTS, _invalidate_task
+from .schemas import CategoryCreate, CategoryUpdate, TaskCreate, TaskUpdate
+from .core.pagination import encode_cursor, decode_cursor
+from .core.cache import row_cache
+from .core.versioning import board_version
+from .core.events import event_bus
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Async mirrors of the functions in crud.py, used when USE_ASYNC_DB is enabled.
+# Category.tasks is always loaded eagerly here because lazy loads are not allowed on an AsyncSession.
+# Writes invalidate the same row_cache keys as crud.py, since the sync routes still read through it.
+
+def _category_row(category: Category) -> dict:
+    return {"id": category.id, "name": category.name, "category_order": category.category_order}
+
+def _task_row(task: Task) -> dict:
+    return {"id": task.id, "title": task.title, "description": task.description,
+            "task_order": task.task_order, "category_id": task.category_id}
+
+###############################################################################################################
+##############################################  Categories CRUD  ##############################################
+
+async def get_categories(db: AsyncSession, skip: int = 0, limit: int = 10):
+    logger.info("Fetching categories with skip=%s, limit=%s", skip, limit)
+    try:
+        result = await db.execute(
+            select(Category)
+            .options(selectinload(Category.tasks))
+            .where(Category.deleted_at.is_(None))
+            .order_by(Category.id.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def get_categories_page(db: AsyncSession, cursor=None, limit: int = 10):
+    logger.info("Fetching categories page after cursor=%s, limit=%s", cursor, limit)
+    try:
+        query = select(Category).options(selectinload(Category.tasks)).where(Category.deleted_at.is_(None))
+        if cursor:
+            last_order, last_id = decode_cursor(cursor)
+            query = query.where(
+                Category.category_order >= last_order,
+                or_(Category.category_order > last_order, and_(Category.category_order == last_order, Category.id > last_id)),
+            )
+        result = await db.execute(query.order_by(Category.category_order.asc(), Category.id.asc()).limit(limit + 1))
+        rows = result.scalars().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].category_order, rows[-1].id)
+        return {"items": rows, "next_cursor": next_cursor}
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def get_category(db: AsyncSession, category_id: int):
+    logger.info("Fetching category with ID: %s", category_id)
+    try:
+        result = await db.execute(
+            select(Category).options(selectinload(Category.tasks)).where(Category.id == category_id, Category.deleted_at.is_(None))
+        )
+        return result.scalars().first()
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def create_category(db: AsyncSession, category: CategoryCreate):
+    logger.info("Creating category with name: %s", category.name)
+    try:
+        db_category = Category(name=category.name, category_order=category.category_order, tasks=[])
+        db.add(db_category)
+        await db.commit()
+        board_version.bump()
+        event_bus.publish("category.created", category=_category_row(db_category))
+        return db_category
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def update_category(db: AsyncSession, category_id: int, category: CategoryUpdate):
+    logger.info("Updating category with ID %s to name: %s", category_id, category.name)
+    try:
+        db_category = await get_category(db, category_id)
+        if not db_category:
+            return None
+        db_category.name = category.name
+        db_category.category_order = category.category_order
+        await db.commit()
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        event_bus.publish("category.updated", category=_category_row(db_category))
+        return db_category
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def _task_count(db: AsyncSession, category_id: int) -> int:
+    if db.get_bind().dialect.name in TASK_COUNT_DIALECTS:
+        return (await db.execute(select(Category.task_count).where(Category.id == category_id))).scalar() or 0
+    return (await db.execute(select(func.count()).select_from(Task).where(Task.category_id == category_id))).scalar()
+
+async def delete_category(db: AsyncSession, category_id: int, soft_delete_min_tasks: int = 0):
+    try:
+        logger.info("Deleting category with ID %s", category_id)
+        # ON DELETE CASCADE removes the tasks; none are loaded into the session. Large
+        # categories are only hidden and left to the purge thread, as in crud.delete_category
+        soft = soft_delete_min_tasks > 0 and await _task_count(db, category_id) >= soft_delete_min_tasks
+        if soft:
+            statement = update(Category).where(Category.id == category_id, Category.deleted_at.is_(None)).values(deleted_at=func.now())
+        else:
+            statement = delete(Category).where(Category.id == category_id, Category.deleted_at.is_(None))
+        deleted = (await db.execute(statement.returning(Category.id), execution_options={"synchronize_session": False})).first()
+        if deleted is None:
+            await db.rollback()
+            logger.error("Category with ID %s not found for deletion", category_id)
+            return None
+        await db.commit()
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        row_cache.invalidate_matching(lambda key, value: key[0] == "task" and value.category_id == category_id)
+        event_bus.publish("category.deleted", id=category_id)
+        if soft:
+            logger.info("Category with ID %s hidden; its tasks will be purged in the background", category_id)
+        else:
+            logger.info("Category with ID %s successfully deleted", category_id)
+        return {"message": f"Category with ID: {category_id} is deleted", "purge_pending": soft}
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+
+################################################################################################################
+#################################################  Tasks CRUD  #################################################
+
+async def _live_task(db: AsyncSession, task_id: int):
+    """The task, or None when it is missing or its category is soft-deleted."""
+    result = await db.execute(select(Task).where(Task.id == task_id, LIVE_TASK))
+    return result.scalars().first()
+
+async def _live_category(db: AsyncSession, category_id: int):
+    category = await db.get(Category, category_id)
+    return category if category is not None and category.deleted_at is None else None
+
+async def get_task_by_task_id(db: AsyncSession, task_id: int):
+    logger.info("Fetching task with ID: %s", task_id)
+    try:
+        return await _live_task(db, task_id)
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def create_task(db: AsyncSession, task: TaskCreate, category_id: int):
+    logger.info("Creating task with title: %s in category with ID: %s", task.title, category_id)
+    try:
+        if not await _live_category(db, category_id):
+            logger.error("Category with ID %s not found", category_id)
+            raise HTTPException(status_code=404, detail="Category not found")
+        db_task = Task(title=task.title, description=task.description, task_order=task.task_order, category_id=category_id)
+        db.add(db_task)
+        await db.commit()
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        event_bus.publish("task.created", task=_task_row(db_task))
+        return db_task
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def update_task(db: AsyncSession, task_id: int, task: TaskUpdate):
+    logger.info("Updating task with ID %s to title: %s", task_id, task.title)
+    try:
+        db_task = await _live_task(db, task_id)
+        if not db_task:
+            return None
+
+        # Check if the category_id exists and is not soft-deleted
+        category = await _live_category(db, task.category_id)
+        if not category:
+            logger.error("Category with ID %s not found", task.category_id)
+            raise HTTPException(status_code=404, detail="Category not found")
+
+        db_task.title = task.title
+        db_task.description = task.description
+        db_task.task_order = task.task_order
+        db_task.category_id = task.category_id
+        await db.commit()
+        board_version.bump()
+        _invalidate_task(task_id, task.category_id)
+        event_bus.publish("task.updated", task=_task_row(db_task))
+        return db_task
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+async def delete_task(db: AsyncSession, task_id: int):
+    try:
+        db_task = await _live_task(db, task_id)
+        if not db_task:
+            logger.error("Task with ID %s not found for deletion", task_id)
+            return None
+        logger.info("Deleting task with ID %s", task_id)
+        await db.delete(db_task)
+        await db.commit()
+        board_version.bump()
+        row_cache.invalidate(("task", task_id), ("category", db_task.category_id))
+        event_bus.publish("task.deleted", id=task_id, category_id=db_task.category_id)
+        logger.info("Task with ID %s successfully deleted", task_id)
+        return {"message": f"Task with ID: {task_id} is deleted"}
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
@@ -0,0 +1,163 @@
+from starlette.responses import JSONResponse
+from collections import deque
+import asyncio
+import logging
+import math
+import os
+
+logger = logging.getLogger(__name__)
+
+# Heavy endpoints get their own small group so an import or export burst cannot starve plain reads
+BULK_PREFIXES = ("/v1/tasks/bulk", "/v1/import", "/v1/export")
+# Long-lived streams would hold a slot for their whole lifetime
+EXEMPT_PATHS = ("/v1/events",)
+
+
+def route_group(method: str, path: str):
+    """Admission group for a request, or None when it bypasses admission (internal, metrics, SSE)."""
+    if not path.startswith("/v1/") or path in EXEMPT_PATHS:
+        return None
+    if path.startswith(BULK_PREFIXES):
+        return "bulk"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+
+class AdmissionGate:
+    """At most ``limit`` requests in flight, at most ``queue_size`` waiting up to ``wait_timeout`` seconds.
+
+    Runs on the event loop before a request reaches the threadpool, so excess work is
+    turned away before it holds a worker thread or a database connection. Waiters are
+    admitted in arrival order.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, wait_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.wait_timeout = wait_timeout
+        self.in_flight = 0
+        self._waiters = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def acquire(self) -> bool:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.wait_timeout)
+        except asyncio.TimeoutError:
+            # release() may have handed over the slot just as the deadline passed
+            if not waiter.done():
+                waiter.cancel()
+                self.timed_out += 1
+                return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.admitted += 1
+        return True
+
+    def release(self):
+        # Hand the slot straight to the oldest live waiter; in_flight stays the same
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "wait_timeout_ms": round(self.wait_timeout * 1000),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class AdmissionMiddleware:
+    """Reject with ``reject_status`` and Retry-After once a route group is saturated."""
+
+    def __init__(self, app, gates: dict, reject_status: int = 503, retry_after: float = 1.0):
+        self.app = app
+        self.gates = gates
+        self.reject_status = reject_status
+        self.retry_after = str(max(1, math.ceil(retry_after)))
+
+    async def __call__(self, scope, receive, send):
+        gate = self.gates.get(route_group(scope["method"], scope["path"])) if scope["type"] == "http" else None
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+        if not await gate.acquire():
+            logger.info("Admission rejected %s %s: %s group saturated", scope["method"], scope["path"], gate.name)
+            response = JSONResponse(
+                {"detail": "Server busy, retry later"},
+                status_code=self.reject_status,
+                headers={"Retry-After": self.retry_after},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+
+def _gate(name: str, limit: int, queue_size: int, wait_timeout: float) -> AdmissionGate:
+    prefix = f"ADMISSION_{name.upper()}"
+    return AdmissionGate(
+        name,
+        limit=int(os.getenv(f"{prefix}_LIMIT", str(limit))),
+        queue_size=int(os.getenv(f"{prefix}_QUEUE", str(queue_size))),
+        wait_timeout=wait_timeout,
+    )
+
+
+def _load_gates() -> dict:
+    """Gates per route group from ADMISSION_{READ,WRITE,BULK}_{LIMIT,QUEUE} and ADMISSION_WAIT_MS.
+
+    Defaults keep the sum of limits near the database pool (5 + 10 overflow) rather
+    than the 40-thread pool, so admitted requests rarely wait for a connection.
+    ADMISSION_ENABLED=false turns admission off.
+    """
+    if os.getenv("ADMISSION_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return {}
+    wait_timeout = float(os.getenv("ADMISSION_WAIT_MS", "500")) / 1000
+    return {
+        "read": _gate("read", 12, 24, wait_timeout),
+        "write": _gate("write", 6, 12, wait_timeout),
+        "bulk": _gate("bulk", 2, 2, wait_timeout),
+    }
+
+
+admission_gates = _load_gates()
+
+
+def admission_options() -> dict:
+    """AdmissionMiddleware settings; ADMISSION_REJECT_STATUS picks 503 (default) or 429."""
+    return {
+        "gates": admission_gates,
+        "reject_status": int(os.getenv("ADMISSION_REJECT_STATUS", "503")),
+        "retry_after": float(os.getenv("ADMISSION_RETRY_AFTER", "1")),
+    }
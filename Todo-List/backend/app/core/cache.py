@@ -0,0 +1,90 @@
+from collections import OrderedDict
+import os
+import threading
+import time
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after ``ttl`` seconds.
+
+    The cache is per process, so with several workers an entry can be stale for at
+    most ``ttl`` seconds after another worker writes the same row.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def peek(self, key):
+        """Current value without touching LRU order, expiry or counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def invalidate_matching(self, predicate):
+        """Drop every entry whose (key, value) satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key, (value, _) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+row_cache = TTLCache(
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "1024")),
+    ttl=float(os.getenv("CACHE_TTL_SECONDS", "30")),
+    enabled=os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+)
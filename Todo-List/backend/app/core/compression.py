@@ -0,0 +1,211 @@
+from starlette.datastructures import Headers, MutableHeaders
+from .cache import TTLCache
+import gzip
+import logging
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional; br is simply not offered
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # optional; zstd is simply not offered
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+# Server-sent events must reach the client message by message, so they are never compressed
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+class _Gzip:
+    name = "gzip"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def stream(self):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+class _Brotli:
+    name = "br"
+
+    def __init__(self, level: int = 5):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.level)
+
+    def stream(self):
+        compressor = brotli.Compressor(quality=self.level)
+        return compressor.process, compressor.flush, compressor.finish
+
+
+class _Zstd:
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def stream(self):
+        compressor = zstandard.ZstdCompressor(level=self.level).compressobj()
+        return (compressor.compress,
+                lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+                compressor.flush)
+
+
+def available_encoders() -> dict:
+    """Encoders usable in this process, by content-coding name."""
+    encoders = {"gzip": _Gzip()}
+    if brotli is not None:
+        encoders["br"] = _Brotli()
+    if zstandard is not None:
+        encoders["zstd"] = _Zstd()
+    return encoders
+
+
+def negotiate(accept_encoding: str, preference) -> str:
+    """Best coding from ``preference`` the client accepts, or None for identity.
+
+    Client q-values decide first; ties go to the earlier entry in ``preference``.
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in preference:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Compress responses for clients that send Accept-Encoding.
+
+    Bodies smaller than ``minimum_size`` and non-text types go out unchanged.
+    Streaming responses (the export) are compressed chunk by chunk and flushed
+    after each one. A complete body that carries an ETag is cached compressed,
+    keyed by path, query, coding and ETag. Board ETags change on every write,
+    so polls of an unchanged board reuse the bytes instead of compressing again.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, encodings=("zstd", "br", "gzip"), cache_entries: int = 32):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = available_encoders()
+        self.preference = [coding for coding in encodings if coding in self.encoders]
+        self.cache = TTLCache(max_entries=max(cache_entries, 1), ttl=3600.0, enabled=cache_entries > 0)
+        logger.info("Response compression with %s for bodies of %s bytes or more", self.preference, minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.preference:
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.preference)
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(self, scope, self.encoders[coding], send))
+
+
+class _CompressingSend:
+    """The ``send`` callable handed to the app for one compressed response."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope, encoder, send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoder = encoder
+        self.send = send
+        self.start = None
+        self.mode = None
+        self.stream = None
+
+    def _eligible(self, headers: MutableHeaders) -> bool:
+        content_type = headers.get("content-type", "")
+        return (
+            self.start["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+            and not content_type.startswith(UNCOMPRESSIBLE_TYPES)
+        )
+
+    def _cache_key(self, headers: MutableHeaders):
+        etag = headers.get("etag")
+        if etag is None:
+            return None
+        return (self.scope["path"], self.scope.get("query_string", b""), self.encoder.name, etag)
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.mode is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            if not self._eligible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+                self.mode = "identity"
+            elif not more_body:
+                key = self._cache_key(headers)
+                compressed = self.middleware.cache.get(key) if key else None
+                if compressed is None:
+                    compressed = self.encoder.compress(body)
+                    if key:
+                        self.middleware.cache.set(key, compressed)
+                headers["Content-Encoding"] = self.encoder.name
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            else:
+                self.mode = "stream"
+                self.stream = self.encoder.stream()
+                headers["Content-Encoding"] = self.encoder.name
+                headers.add_vary_header("Accept-Encoding")
+                del headers["Content-Length"]
+            await self.send(self.start)
+
+        if self.mode == "identity":
+            await self.send(message)
+            return
+        compress, flush, finish = self.stream
+        chunk = compress(body) + (flush() if more_body else finish())
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+def compression_options() -> dict:
+    """CompressionMiddleware settings from COMPRESSION_MIN_SIZE, COMPRESSION_ENCODINGS and COMPRESSION_CACHE_ENTRIES."""
+    return {
+        "minimum_size": int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+        "encodings": [coding.strip() for coding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if coding.strip()],
+        "cache_entries": int(os.getenv("COMPRESSION_CACHE_ENTRIES", "32")),
+    }
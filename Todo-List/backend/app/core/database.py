@@ -1,15 +1,241 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
+from .metrics import current_request_stats, query_duration
+import logging
 import os
+import threading
+import time
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-DATABASE_URL = os.getenv("DATABASE_URI")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _env_bool(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+class PoolStats:
+    """Connection wait counters collected by InstrumentedQueuePool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.waits = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.waits += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.waits,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.waits * 1000, 3) if self.waits else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+
+class _WaitRecordingPool:
+    """Records how long each checkout waited for a connection in ``wait_stats``."""
+
+    wait_stats = pool_stats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_WaitRecordingPool, QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+
+class InstrumentedAsyncQueuePool(_WaitRecordingPool, AsyncAdaptedQueuePool):
+    """The async engine's pool; asyncio engines cannot use a plain QueuePool."""
+
+    wait_stats = async_pool_stats
+
+
+def _engine_options(url: str, poolclass=InstrumentedQueuePool) -> dict:
+    options = {
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING"),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "-1")),
+    }
+    # In-memory SQLite needs its per-thread pool; every other database gets a sized, instrumented queue
+    parsed = make_url(url)
+    if not (parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")):
+        options.update(
+            poolclass=poolclass,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        )
+    return options
+
+
+def _pool_status(pool, stats: PoolStats) -> dict:
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    status.update(stats.snapshot())
+    return status
+
+
+def get_pool_status() -> dict:
+    status = _pool_status(get_engine().pool, pool_stats)
+    if _async_engine is not None:
+        status["async"] = _pool_status(_async_engine.pool, async_pool_stats)
+    return status
+
+
+SLOW_QUERY_SECONDS = float(os.getenv("SLOW_QUERY_MS", "200")) / 1000
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite leaves foreign keys unenforced unless asked; crud relies on them for category validation
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    query_duration.observe((), elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_time += elapsed
+    if elapsed >= SLOW_QUERY_SECONDS:
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+_engine = None
+_replica_engine = None
+_async_engine = None
+_engine_lock = threading.Lock()
+
+
+def _install_hooks(engine):
+    """Foreign keys on SQLite and per-query metrics; for an async engine pass its sync_engine."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+    event.listen(engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine, "after_cursor_execute", _record_query)
+
+
+def _build_engine(url: str):
+    engine = create_engine(url, **_engine_options(url))
+    _install_hooks(engine)
+    return engine
+
+
+def get_engine():
+    """The application engine, created on first use so importing the app does no I/O.
+
+    Creating the engine does not connect either; the first connection is opened by
+    the first query. DATABASE_URI is read here, not at import time.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = os.getenv("DATABASE_URI")
+                if not url:
+                    raise RuntimeError("DATABASE_URI is not configured")
+                _engine = _build_engine(url)
+    return _engine
+
+
+def get_replica_engine():
+    """Engine for the optional read replica (REPLICA_DATABASE_URI), or None when unset.
+
+    Only app.core.replica decides when to use it; see ReplicaRouter.
+    """
+    global _replica_engine
+    url = os.getenv("REPLICA_DATABASE_URI")
+    if not url:
+        return None
+    if _replica_engine is None:
+        with _engine_lock:
+            if _replica_engine is None:
+                _replica_engine = _build_engine(url)
+    return _replica_engine
+
+
+def get_async_engine():
+    """Lazily created engine for the opt-in async stack (ASYNC_DATABASE_URI).
+
+    Takes the same DB_POOL_* settings and query hooks as the sync engine; its
+    checkout waits are reported under "async" in get_pool_status().
+    """
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                if not ASYNC_DATABASE_URL:
+                    raise RuntimeError("ASYNC_DATABASE_URI is not configured")
+                # Imported here so the sync stack does not require greenlet
+                from sqlalchemy.ext.asyncio import create_async_engine
+
+                _async_engine = create_async_engine(
+                    ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool)
+                )
+                _install_hooks(_async_engine.sync_engine)
+    return _async_engine
+
+
+async def dispose_engines():
+    """Close pooled connections on shutdown; a no-op for engines never created."""
+    global _engine, _replica_engine, _async_engine
+    with _engine_lock:
+        engine, replica_engine, async_engine = _engine, _replica_engine, _async_engine
+        _engine = _replica_engine = _async_engine = None
+    for sync_engine in (engine, replica_engine):
+        if sync_engine is not None:
+            sync_engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+# Unbound: callers pass bind=get_engine(), so the engine is only built once a session is needed
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+# Opt-in async stack, e.g. ASYNC_DATABASE_URI=postgresql+asyncpg://... or sqlite+aiosqlite:///./todo.db
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URI")
+USE_ASYNC_DB = _env_bool("USE_ASYNC_DB")
 
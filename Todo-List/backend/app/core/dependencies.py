@@ -1,8 +1,27 @@
-from .database import SessionLocal
+from fastapi import Request
+from .database import SessionLocal, get_engine, get_async_engine
+from .replica import replica_router
 
 def get_db():
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db(request: Request):
+    """Session for read-only endpoints: the replica when configured and safe to use, else the primary."""
+    db = SessionLocal(bind=replica_router.engine_for(request))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    # Imported here so the sync stack does not require greenlet
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with AsyncSession(get_async_engine(), autoflush=False, expire_on_commit=False) as db:
+        yield db
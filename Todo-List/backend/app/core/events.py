@@ -0,0 +1,89 @@
+from fastapi.encoders import jsonable_encoder
+import asyncio
+import importlib
+import itertools
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """One connected client: a bounded queue drained on the client's event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.overflowed = 0
+
+    def _put(self, event: dict):
+        # Runs on self.loop. A client that falls behind gets its backlog replaced by a
+        # single resync event instead of slowing down writers or growing without bound.
+        if self.queue.full():
+            self.overflowed += 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = {"id": event["id"], "type": "resync", "data": {"reason": "overflow"}}
+        self.queue.put_nowait(event)
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class EventBus:
+    """In-process fan-out of change events to every subscriber of this worker.
+
+    A multi-worker deployment swaps in a subclass (set EVENT_BUS to its dotted path)
+    whose publish() hands the event to a broker such as Redis pub/sub or Postgres
+    LISTEN/NOTIFY, and which calls deliver() for every message it receives back.
+    Such a subclass should also bump app.core.versioning.board_version for events
+    from other workers, so their cached ETags go stale too.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def publish(self, type: str, **data):
+        """Called by crud.py after a commit; safe from any thread."""
+        self.deliver({"id": next(self._ids), "type": type, "data": jsonable_encoder(data)})
+
+    def deliver(self, event: dict):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, event)
+            except RuntimeError:
+                # The subscriber's loop is closed; it will never unsubscribe itself
+                self.unsubscribe(subscription)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+
+def _load_event_bus() -> EventBus:
+    max_pending = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+    path = os.getenv("EVENT_BUS")
+    if not path:
+        return EventBus(max_pending=max_pending)
+    module_name, _, class_name = path.rpartition(".")
+    logger.info("Using event bus %s", path)
+    return getattr(importlib.import_module(module_name), class_name)(max_pending=max_pending)
+
+
+event_bus = _load_event_bus()
@@ -0,0 +1,99 @@
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a ``rate`` fraction of INFO-and-below records; warnings and errors always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or self.rate >= 1.0 or random.random() < self.rate
+
+
+class _DropQueueHandler(QueueHandler):
+    """Drops records instead of blocking the request when the writer falls behind."""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DropQueueHandler.dropped += 1
+
+
+_listener = None
+_queue_handler = None
+
+
+def setup_logging():
+    """Route every log record through a bounded queue to a background writer thread.
+
+    The request thread only formats the message and enqueues it; file I/O happens on
+    the listener thread. Configured by LOG_LEVEL, LOG_FILE, LOG_FORMAT (text|json),
+    LOG_SAMPLE_RATE (fraction of INFO records kept) and LOG_QUEUE_SIZE.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
+    file_handler = logging.FileHandler(os.getenv("LOG_FILE", "app.log"))
+    file_handler.setFormatter(formatter)
+
+    _queue_handler = _DropQueueHandler(queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000"))))
+    _queue_handler.addFilter(SamplingFilter(float(os.getenv("LOG_SAMPLE_RATE", "1.0"))))
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(_queue_handler)
+    logging.getLogger("watchfiles.main").setLevel(logging.WARNING)
+
+    _listener = QueueListener(_queue_handler.queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> dict:
+    """Queue depth and records dropped because the writer thread fell behind."""
+    log_queue = _queue_handler.queue if _queue_handler is not None else None
+    return {
+        "level": logging.getLevelName(logging.getLogger().level),
+        "queued": log_queue.qsize() if log_queue is not None else 0,
+        "queue_size": log_queue.maxsize if log_queue is not None else 0,
+        "dropped": _DropQueueHandler.dropped,
+    }
@@ -0,0 +1,97 @@
+from contextvars import ContextVar
+from app.core.logging_config import logging_stats
+import bisect
+import threading
+
+
+class Histogram:
+    """Minimal Prometheus histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                base = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels)]
+                cumulative = 0
+                for bound, count in zip(self.buckets, series["counts"]):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_labels(base, bound)} {cumulative}")
+                lines.append(f"{self.name}_bucket{_labels(base, '+Inf')} {series['count']}")
+                label_text = _labels(base)
+                lines.append(f"{self.name}_sum{label_text} {series['sum']}")
+                lines.append(f"{self.name}_count{label_text} {series['count']}")
+        return lines
+
+
+def _labels(pairs, le=None) -> str:
+    if le is not None:
+        pairs = pairs + [f'le="{le}"']
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class RequestStats:
+    """SQL work done while serving one request, filled in by the engine hooks."""
+
+    __slots__ = ("queries", "query_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+
+
+# Set by the timing middleware for the duration of a request; None outside requests
+current_request_stats: ContextVar = ContextVar("current_request_stats", default=None)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Time spent serving HTTP requests.",
+    ("method", "route", "status"), LATENCY_BUCKETS,
+)
+request_queries = Histogram(
+    "db_queries_per_request", "SQL statements executed per HTTP request.",
+    ("route",), (0, 1, 2, 3, 5, 10, 25, 50, 100, 250),
+)
+request_query_time = Histogram(
+    "db_query_seconds_per_request", "Time spent in SQL per HTTP request.",
+    ("route",), LATENCY_BUCKETS,
+)
+query_duration = Histogram(
+    "db_query_duration_seconds", "Duration of individual SQL statements.",
+    (), (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+def render_metrics() -> str:
+    lines = []
+    for histogram in (request_duration, request_queries, request_query_time, query_duration):
+        lines.extend(histogram.render())
+    lines.extend([
+        "# HELP log_records_dropped_total Log records dropped because the log queue was full.",
+        "# TYPE log_records_dropped_total counter",
+        f"log_records_dropped_total {logging_stats()['dropped']}",
+    ])
+    return "\n".join(lines) + "\n"
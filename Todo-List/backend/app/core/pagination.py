@@ -0,0 +1,18 @@
+import base64
+import json
+
+
+def encode_cursor(*key) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Raises ValueError when the token was not produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list) or not all(isinstance(part, int) for part in key):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
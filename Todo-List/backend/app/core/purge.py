@@ -0,0 +1,80 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryPurger:
+    """Purges soft-deleted categories in batches on one background thread.
+
+    A category with at least ``min_tasks`` tasks is not deleted at once: the
+    request only marks it deleted, which hides it, and this thread removes its
+    tasks ``batch_size`` at a time, each batch in its own short transaction,
+    sleeping ``pause`` seconds between batches so other writers get the database.
+    ``min_tasks`` of 0 turns soft deletes off, and every delete is then a single
+    cascading DELETE.
+
+    ``step`` is the callable that does one batch: it returns the number of tasks
+    it deleted, or None once no soft-deleted category is left.
+    """
+
+    def __init__(self, min_tasks: int = 0, batch_size: int = 1000, pause: float = 0.05):
+        self.min_tasks = min_tasks
+        self.batch_size = batch_size
+        self.pause = pause
+        self._lock = threading.Lock()
+        self._running = False
+        self._again = False
+        self.batches = 0
+        self.tasks_purged = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_tasks > 0
+
+    def start(self, step):
+        """Run ``step`` until nothing is left to purge; a purge already running picks up the new work instead."""
+        with self._lock:
+            self._again = True
+            if self._running:
+                return
+            self._running = True
+        threading.Thread(target=self._run, args=(step,), name="category-purge", daemon=True).start()
+
+    def _run(self, step):
+        while True:
+            with self._lock:
+                if not self._again:
+                    self._running = False
+                    return
+                self._again = False
+            try:
+                while (deleted := step()) is not None:
+                    self.batches += 1
+                    self.tasks_purged += deleted
+                    time.sleep(self.pause)
+            except Exception as e:
+                # Leave the rest for the next soft delete or restart rather than retrying in a loop
+                self.errors += 1
+                logger.error("Category purge failed: %s", e)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "min_tasks": self.min_tasks,
+            "batch_size": self.batch_size,
+            "running": self._running,
+            "batches": self.batches,
+            "tasks_purged": self.tasks_purged,
+            "errors": self.errors,
+        }
+
+
+category_purger = CategoryPurger(
+    min_tasks=int(os.getenv("CATEGORY_SOFT_DELETE_MIN_TASKS", "0")),
+    batch_size=int(os.getenv("CATEGORY_PURGE_BATCH_SIZE", "1000")),
+    pause=float(os.getenv("CATEGORY_PURGE_PAUSE_MS", "50")) / 1000,
+)
@@ -0,0 +1,131 @@
+from fastapi import Request
+from sqlalchemy import event, text
+from .database import get_engine, get_replica_engine
+from .versioning import board_version
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Set on successful writes; reads from that client go to the primary until it expires
+PRIMARY_UNTIL_COOKIE = "todo_primary_until"
+
+
+class ReplicaRouter:
+    """Chooses the engine for read-only endpoints.
+
+    A read goes to the replica unless:
+
+    * no replica is configured (REPLICA_DATABASE_URI unset);
+    * this process committed a write within the last ``window`` seconds, so its
+      row cache and ETags are never refilled from a replica that has not caught up;
+    * the client wrote within ``window`` seconds (the PRIMARY_UNTIL_COOKIE cookie,
+      which works across workers, or an ``X-Read-Consistency: primary`` header);
+    * the replica failed its last health check. Checks run at most every
+      ``health_interval`` seconds, and a disconnect error on the replica marks it
+      unhealthy at once.
+
+    ``window`` should exceed the replica's usual lag (REPLICA_READ_YOUR_WRITES_SECONDS).
+    """
+
+    def __init__(self, window: float = 5.0, health_interval: float = 5.0):
+        self.window = window
+        self.health_interval = health_interval
+        self._lock = threading.Lock()
+        self._healthy = True
+        self._checked_at = 0.0
+        self._watched = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def _on_replica_error(self, context):
+        if context.is_disconnect:
+            self._set_health(False)
+
+    def _set_health(self, healthy: bool):
+        with self._lock:
+            changed = healthy != self._healthy
+            self._healthy = healthy
+            self._checked_at = time.monotonic()
+        if changed:
+            logger.warning("Read replica is %s", "healthy again" if healthy else "unhealthy, reading from primary")
+
+    def healthy(self, replica) -> bool:
+        if self._watched is not replica:
+            event.listen(replica, "handle_error", self._on_replica_error)
+            self._watched = replica
+        with self._lock:
+            due = time.monotonic() - self._checked_at >= self.health_interval
+            if due:
+                # Claim the check so concurrent requests keep using the last known state
+                self._checked_at = time.monotonic()
+            if not due:
+                return self._healthy
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            self._set_health(True)
+        except Exception as e:
+            logger.error("Read replica health check failed: %s", e)
+            self._set_health(False)
+        return self._healthy
+
+    def wants_primary(self, request: Request) -> bool:
+        now = time.time()
+        if now - board_version.current()[1] < self.window:
+            return True
+        if request.headers.get("x-read-consistency", "").lower() == "primary":
+            return True
+        try:
+            return float(request.cookies.get(PRIMARY_UNTIL_COOKIE, "0")) > now
+        except ValueError:
+            return False
+
+    def engine_for(self, request: Request):
+        replica = get_replica_engine()
+        if replica is None or self.wants_primary(request) or not self.healthy(replica):
+            self.primary_reads += 1
+            return get_engine()
+        self.replica_reads += 1
+        return replica
+
+    def stats(self) -> dict:
+        return {
+            "configured": get_replica_engine() is not None,
+            "healthy": self._healthy,
+            "read_your_writes_seconds": self.window,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+
+replica_router = ReplicaRouter(
+    window=float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5")),
+    health_interval=float(os.getenv("REPLICA_HEALTH_INTERVAL_SECONDS", "5")),
+)
+
+
+class ReadYourWritesMiddleware:
+    """Stamp successful /v1 writes with PRIMARY_UNTIL_COOKIE so that client's next reads skip the replica."""
+
+    def __init__(self, app, router: ReplicaRouter = replica_router):
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS")
+                or not scope["path"].startswith("/v1/") or get_replica_engine() is None):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.router.window
+                cookie = (f"{PRIMARY_UNTIL_COOKIE}={until:.3f}; Max-Age={int(self.router.window) + 1}; "
+                          "Path=/; HttpOnly; SameSite=Lax")
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,39 @@
+from fastapi import Response
+from fastapi.responses import JSONResponse
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# List and board endpoints skip response_model validation and encode plain dicts
+# built from row tuples. Set FAST_SERIALIZATION=false to go back to the Pydantic path.
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "true").lower() in ("1", "true", "yes")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it is installed.
+
+    Content must already be JSON types (dicts, lists, str, int, float, bool, None);
+    unlike the response_model path nothing is validated or converted.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_response(content, response: Response) -> FastJSONResponse:
+    """Wrap ``content`` in a FastJSONResponse, keeping headers set on the injected ``response``.
+
+    FastAPI drops the injected response's headers (ETag, Last-Modified) when an
+    endpoint returns a Response of its own, so they are copied across here.
+    """
+    fast = FastJSONResponse(content)
+    for key, value in response.headers.items():
+        if key not in ("content-length", "content-type"):
+            fast.headers[key] = value
+    return fast
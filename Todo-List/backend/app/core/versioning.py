@@ -0,0 +1,70 @@
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import Request, Response
+import threading
+import time
+import uuid
+
+
+class BoardVersion:
+    """Monotonic counter bumped by every write in crud.py.
+
+    Read endpoints derive their ETag and Last-Modified from it, so an unchanged
+    poll can be answered with 304 before touching the database.
+
+    The counter lives in this process only, so conditional GETs are only correct
+    with a single worker. The boot id in the ETag stops a tag from one worker or
+    restart matching another, but it cannot tell worker A about a write served
+    by worker B: a client that keeps reaching A gets 304 for a board B changed,
+    until A's own counter moves. Run one worker (uvicorn's default) or send
+    conditional requests to the same worker that takes the writes.
+
+    Last-Modified has whole-second resolution, so it is only sent once the
+    second of the last write is over. A write later in that same second would
+    otherwise carry the same date and If-Modified-Since would call it current;
+    until then clients revalidate with the ETag alone.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._boot_id = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.last_modified = time.time()
+
+    def bump(self):
+        with self._lock:
+            self.version += 1
+            self.last_modified = time.time()
+
+    def current(self):
+        with self._lock:
+            return self.version, self.last_modified
+
+    def etag(self, version: int) -> str:
+        return f'W/"{self._boot_id}-{version}"'
+
+    def not_modified(self, request: Request, response: Response) -> bool:
+        """Set validators on ``response`` and report whether the client copy is current."""
+        version, last_modified = self.current()
+        etag = self.etag(version)
+        response.headers["ETag"] = etag
+        if int(last_modified) < int(time.time()):
+            response.headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+        response.headers["Cache-Control"] = "no-cache"
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and "Last-Modified" in response.headers:
+            try:
+                return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def not_modified_response(self, response: Response) -> Response:
+        headers = {key: response.headers[key] for key in ("ETag", "Last-Modified", "Cache-Control") if key in response.headers}
+        return Response(status_code=304, headers=headers)
+
+
+board_version = BoardVersion()
@@ -1,98 +1,345 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from .models import Category, Task
-from .schemas import CategoryCreate, CategoryUpdate, TaskCreate, Task as TaskSchema, TaskUpdate
+from sqlalchemy import and_, or_, exists, func, insert, literal, update, delete, select, text
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from pydantic import ValidationError
+from .models import Category, Task, TASK_COUNT_DIALECTS
+from .schemas import Category as CategorySchema, CategoryCreate, CategoryUpdate, CategoryPatch, TaskCreate, Task as TaskSchema, TaskUpdate, TaskPatch, ReorderRequest, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete
+from .core.pagination import encode_cursor, decode_cursor
+from .core.cache import row_cache
+from .core.versioning import board_version
+from .core.events import event_bus
+import csv
+import io
+import json
 import logging
 
-logging.basicConfig(filename='app.log', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TASK_COLUMNS = (Task.id, Task.title, Task.description, Task.task_order, Task.category_id)
+CATEGORY_COLUMNS = (Category.id, Category.name, Category.category_order)
+
+# Soft-deleted categories and their tasks are hidden from every read while they wait for a purge
+LIVE_CATEGORY = Category.deleted_at.is_(None)
+LIVE_TASK = Task.category_id.not_in(select(Category.id).where(Category.deleted_at.is_not(None)))
+LIVE_TASK_SQL = "AND tasks.category_id NOT IN (SELECT id FROM categories WHERE deleted_at IS NOT NULL)"
+
+def _live_category(category_id):
+    """Condition true while ``category_id`` names a category that exists and is not soft-deleted.
+
+    Writes put it in their own WHERE clause, so a category soft-deleted at the
+    same moment cannot receive a task that the purge would then remove.
+    """
+    return exists().where(Category.id == category_id, LIVE_CATEGORY)
+
+# Spacing between neighbouring order keys, so a move usually fits between two rows without touching them
+ORDER_GAP = 1024
+
 
 ###############################################################################################################
 ##############################################  Categories CRUD  ##############################################
 
-def get_categories(db: Session, skip: int = 0, limit: int = 10):
-    logger.info(f"Fetching categories with skip={skip}, limit={limit}")
+def _with_tasks(db: Session, category_rows):
+    """Plain dicts for ``category_rows`` (CATEGORY_COLUMNS tuples) with their tasks nested.
+
+    The fast serialization path: two tuple queries, no ORM identity map and no
+    Pydantic validation, ready for FastJSONResponse.
+    """
+    categories = [{"id": id, "name": name, "category_order": order, "tasks": []} for id, name, order in category_rows]
+    if not categories:
+        return categories
+    by_id = {category["id"]: category["tasks"] for category in categories}
+    task_rows = db.execute(
+        select(*TASK_COLUMNS)
+        .where(Task.category_id.in_(list(by_id)))
+        .order_by(Task.category_id, Task.task_order, Task.id)
+    )
+    for id, title, description, task_order, category_id in task_rows:
+        by_id[category_id].append({"id": id, "title": title, "description": description,
+                                   "task_order": task_order, "category_id": category_id})
+    return categories
+
+def get_categories(db: Session, skip: int = 0, limit: int = 10, as_dicts: bool = False):
+    logger.info("Fetching categories with skip=%s, limit=%s", skip, limit)
     try:
-        categories = db.query(Category).order_by(Category.id.asc()).offset(skip).limit(limit).all()
-        for category in categories:
-            category.tasks = db.query(Task).filter(Task.category_id == category.id).order_by(Task.task_order.asc()).all()
+        if as_dicts:
+            rows = db.execute(select(*CATEGORY_COLUMNS).where(LIVE_CATEGORY).order_by(Category.id.asc()).offset(skip).limit(limit))
+            return _with_tasks(db, rows)
+        # Tasks are fetched for the whole page in one extra IN query instead of one query per category
+        categories = (
+            db.query(Category)
+            .options(selectinload(Category.tasks))
+            .filter(LIVE_CATEGORY)
+            .order_by(Category.id.asc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         return categories
     except SQLAlchemyError as e:
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def get_board(db: Session, as_dicts: bool = False):
+    logger.info("Fetching board snapshot")
+    try:
+        if as_dicts:
+            rows = db.execute(
+                select(*CATEGORY_COLUMNS).where(LIVE_CATEGORY).order_by(Category.category_order.asc(), Category.id.asc())
+            )
+            return _with_tasks(db, rows)
+        categories = (
+            db.query(Category)
+            .options(selectinload(Category.tasks))
+            .filter(LIVE_CATEGORY)
+            .order_by(Category.category_order.asc(), Category.id.asc())
+            .all()
+        )
+        return categories
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
         raise
     
+def _keyset_page(query, model, order_column, cursor, limit: int):
+    """Rows strictly after ``cursor`` on ``(order_column, id)`` plus the cursor for the following page."""
+    if cursor:
+        last_order, last_id = decode_cursor(cursor)
+        # The redundant >= bound lets the index seek to the cursor; the OR alone makes it walk every earlier row
+        query = query.filter(
+            order_column >= last_order,
+            or_(order_column > last_order, and_(order_column == last_order, model.id > last_id)),
+        )
+    rows = query.order_by(order_column.asc(), model.id.asc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, order_column.key), last.id)
+    return {"items": rows, "next_cursor": next_cursor}
+
+def get_categories_page(db: Session, cursor=None, limit: int = 10, as_dicts: bool = False):
+    logger.info("Fetching categories page after cursor=%s, limit=%s", cursor, limit)
+    try:
+        if as_dicts:
+            page = _keyset_page(db.query(*CATEGORY_COLUMNS).filter(LIVE_CATEGORY), Category, Category.category_order, cursor, limit)
+            page["items"] = _with_tasks(db, page["items"])
+            return page
+        query = db.query(Category).options(selectinload(Category.tasks)).filter(LIVE_CATEGORY)
+        return _keyset_page(query, Category, Category.category_order, cursor, limit)
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def get_category_summary(db: Session):
+    """Every category in board order with its task count and no task bodies."""
+    logger.info("Fetching category summary")
+    try:
+        if db.get_bind().dialect.name in TASK_COUNT_DIALECTS:
+            # Trigger-maintained counter: one row per category, whatever the number of tasks
+            statement = select(*CATEGORY_COLUMNS, Category.task_count)
+        else:
+            task_count = func.count(Task.id).label("task_count")
+            statement = (
+                select(*CATEGORY_COLUMNS, task_count)
+                .outerjoin(Task, Task.category_id == Category.id)
+                .group_by(*CATEGORY_COLUMNS)
+            )
+        rows = db.execute(statement.where(LIVE_CATEGORY).order_by(Category.category_order.asc(), Category.id.asc()))
+        return [row._asdict() for row in rows]
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
 def get_category(db: Session, category_id: int):
-    logger.info(f"Fetching category with ID: {category_id}")
+    """Read-through cached snapshot of a category and its tasks, or None."""
+    logger.info("Fetching category with ID: %s", category_id)
     try:
-        category = db.query(Category).filter(Category.id == category_id).first()
-        return category
+        cached = row_cache.get(("category", category_id))
+        if cached is not None:
+            return cached
+        category = (
+            db.query(Category).options(selectinload(Category.tasks)).filter(Category.id == category_id, LIVE_CATEGORY).first()
+        )
+        if category is None:
+            return None
+        snapshot = CategorySchema.model_validate(category)
+        row_cache.set(("category", category_id), snapshot)
+        return snapshot
     except SQLAlchemyError as e:
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
 
 def create_category(db: Session, category: CategoryCreate):
-    logger.info(f"Creating category with name: {category.name}")
+    logger.info("Creating category with name: %s", category.name)
     try:
-        db_category = Category(name=category.name, category_order=category.category_order)
-        db.add(db_category)
+        statement = insert(Category).values(name=category.name, category_order=category.category_order).returning(*CATEGORY_COLUMNS)
+        row = db.execute(statement).one()
         db.commit()
-        db.refresh(db_category)
-        return db_category
+        board_version.bump()
+        event_bus.publish("category.created", category=dict(row._mapping))
+        return {**row._mapping, "tasks": []}
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
 
 def update_category(db: Session, category_id: int, category: CategoryUpdate):
-    logger.info(f"Updating category with ID {category_id} to name: {category.name}")
+    logger.info("Updating category with ID %s to name: %s", category_id, category.name)
     try:
-        db_category = db.query(Category).filter(Category.id == category_id).first()
-        if not db_category:
+        statement = (
+            update(Category)
+            .where(Category.id == category_id, LIVE_CATEGORY)
+            .values(name=category.name, category_order=category.category_order)
+            .returning(*CATEGORY_COLUMNS)
+        )
+        row = db.execute(statement, execution_options={"synchronize_session": False}).first()
+        if row is None:
+            db.rollback()
             return None
-        db_category.name = category.name
-        db.category_order = category.category_order
+        tasks = db.execute(
+            select(*TASK_COLUMNS).where(Task.category_id == category_id).order_by(Task.task_order.asc())
+        ).all()
         db.commit()
-        db.refresh(db_category)
-        return db_category
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        event_bus.publish("category.updated", category=dict(row._mapping))
+        return {**row._mapping, "tasks": [dict(task._mapping) for task in tasks]}
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def _changed_only(model, pk: int, changes: dict):
+    """UPDATE limited to ``changes`` that matches no row when every value is already current."""
+    return (
+        update(model)
+        .where(model.id == pk, or_(*(getattr(model, name).is_distinct_from(value) for name, value in changes.items())))
+        .values(**changes)
+    )
+
+def patch_category(db: Session, category_id: int, category: CategoryPatch):
+    """Write only the fields sent; a patch that changes nothing issues no UPDATE and bumps nothing."""
+    changes = category.model_dump(exclude_none=True)
+    logger.info("Patching category with ID %s: %s", category_id, sorted(changes))
+    try:
+        if changes:
+            statement = _changed_only(Category, category_id, changes).where(LIVE_CATEGORY).returning(*CATEGORY_COLUMNS)
+            row = db.execute(statement, execution_options={"synchronize_session": False}).first()
+            if row is not None:
+                tasks = db.execute(
+                    select(*TASK_COLUMNS).where(Task.category_id == category_id).order_by(Task.task_order.asc())
+                ).all()
+                db.commit()
+                board_version.bump()
+                row_cache.invalidate(("category", category_id))
+                event_bus.publish("category.updated", category=dict(row._mapping))
+                return {**row._mapping, "tasks": [dict(task._mapping) for task in tasks]}
+            db.rollback()
+        # Nothing to write: either a no-op or an unknown id, which get_category reports as None
+        return get_category(db, category_id=category_id)
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
 
-def delete_category(db: Session, category_id: int):
+def _task_count(db: Session, category_id: int) -> int:
+    if db.get_bind().dialect.name in TASK_COUNT_DIALECTS:
+        return db.execute(select(Category.task_count).where(Category.id == category_id)).scalar() or 0
+    return db.execute(select(func.count()).select_from(Task).where(Task.category_id == category_id)).scalar()
+
+def delete_category(db: Session, category_id: int, soft_delete_min_tasks: int = 0):
+    """Delete a category and its tasks with one statement.
+
+    ON DELETE CASCADE removes the tasks inside the database, so none of them is
+    loaded or sent back here. A category with at least ``soft_delete_min_tasks``
+    tasks (0 turns this off) is only marked deleted instead: it disappears from
+    every read at once and purge_deleted_categories removes it in batches.
+    """
     try:
-        db_category = db.query(Category).filter(Category.id == category_id).first()
-        if not db_category:
-            logger.error(f"Category with ID {category_id} not found for deletion")
+        logger.info("Deleting category with ID %s", category_id)
+        soft = soft_delete_min_tasks > 0 and _task_count(db, category_id) >= soft_delete_min_tasks
+        if soft:
+            statement = update(Category).where(Category.id == category_id, LIVE_CATEGORY).values(deleted_at=func.now())
+        else:
+            statement = delete(Category).where(Category.id == category_id, LIVE_CATEGORY)
+        deleted = db.execute(statement.returning(Category.id), execution_options={"synchronize_session": False}).first()
+        if deleted is None:
+            db.rollback()
+            logger.error("Category with ID %s not found for deletion", category_id)
             return None
-        logger.info(f"Deleting category with ID {category_id}")
-        db.delete(db_category)
         db.commit()
-        logger.info(f"Category with ID {category_id} successfully deleted")
-        return {"message": f"Category with ID: {category_id} is deleted"}
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        row_cache.invalidate_matching(lambda key, value: key[0] == "task" and value.category_id == category_id)
+        event_bus.publish("category.deleted", id=category_id)
+        if soft:
+            logger.info("Category with ID %s hidden; its tasks will be purged in the background", category_id)
+        else:
+            logger.info("Category with ID %s successfully deleted", category_id)
+        return {"message": f"Category with ID: {category_id} is deleted", "purge_pending": soft}
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def purge_deleted_categories(db: Session, batch_size: int = 1000):
+    """Delete up to ``batch_size`` tasks of the oldest soft-deleted category, and the category once it is empty.
+
+    Each call is one short transaction. Returns the number of tasks deleted, or
+    None when no soft-deleted category is left.
+    """
+    try:
+        category_id = db.execute(
+            select(Category.id).where(Category.deleted_at.is_not(None)).order_by(Category.deleted_at, Category.id).limit(1)
+        ).scalar()
+        if category_id is None:
+            return None
+        batch = select(Task.id).where(Task.category_id == category_id).limit(batch_size).scalar_subquery()
+        deleted = db.execute(delete(Task).where(Task.id.in_(batch)), execution_options={"synchronize_session": False}).rowcount
+        if deleted < batch_size:
+            # Last batch; the cascade also takes any task added since the soft delete
+            db.execute(delete(Category).where(Category.id == category_id), execution_options={"synchronize_session": False})
+            logger.info("Purged soft-deleted category with ID %s", category_id)
+        db.commit()
+        return deleted
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
         raise
     
     
@@ -100,79 +347,707 @@ def delete_category(db: Session, category_id: int):
 #################################################  Tasks CRUD  #################################################
 
 def get_task_by_task_id(db: Session, task_id: int):
-    logger.info(f"Fetching task with ID: {task_id}")
+    """Read-through cached snapshot of a task, or None."""
+    logger.info("Fetching task with ID: %s", task_id)
+    try:
+        cached = row_cache.get(("task", task_id))
+        if cached is not None:
+            return cached
+        task = db.query(Task).filter(Task.id == task_id, LIVE_TASK).first()
+        if task is None:
+            return None
+        snapshot = TaskSchema.model_validate(task)
+        row_cache.set(("task", task_id), snapshot)
+        return snapshot
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def get_tasks_page(db: Session, category_id: int, cursor=None, limit: int = 50, as_dicts: bool = False):
+    logger.info("Fetching tasks page for category %s after cursor=%s, limit=%s", category_id, cursor, limit)
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
-        return task
+        if as_dicts:
+            query = db.query(*TASK_COLUMNS).filter(Task.category_id == category_id, LIVE_TASK)
+            page = _keyset_page(query, Task, Task.task_order, cursor, limit)
+            page["items"] = [row._asdict() for row in page["items"]]
+            return page
+        query = db.query(Task).filter(Task.category_id == category_id, LIVE_TASK)
+        return _keyset_page(query, Task, Task.task_order, cursor, limit)
     except SQLAlchemyError as e:
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
 
+def _fts5_query(q: str) -> str:
+    """Quote every term so user input cannot use FTS5 operators; the last term also matches as a prefix."""
+    terms = ['"' + term.replace('"', '""') + '"' for term in q.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+def search_tasks(db: Session, q: str, category_id=None, limit: int = 20, offset: int = 0):
+    logger.info("Searching tasks for q=%r, category_id=%s, limit=%s, offset=%s", q, category_id, limit, offset)
+    try:
+        if not q.split():
+            # Nothing to match; FTS5 rejects an empty MATCH expression
+            return {"items": [], "next_offset": None}
+        dialect = db.get_bind().dialect.name
+        params = {"category_id": category_id, "limit": limit + 1, "offset": offset}
+        category_filter = "AND tasks.category_id = :category_id" if category_id is not None else ""
+        category_filter += " " + LIVE_TASK_SQL
+        if dialect == "sqlite":
+            params["q"] = _fts5_query(q)
+            statement = text(
+                "SELECT tasks.id, tasks.title, tasks.description, tasks.task_order, tasks.category_id, "
+                "-bm25(tasks_fts) AS rank FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid "
+                f"WHERE tasks_fts MATCH :q {category_filter} "
+                "ORDER BY bm25(tasks_fts), tasks.id LIMIT :limit OFFSET :offset"
+            )
+        elif dialect == "postgresql":
+            params["q"] = q
+            statement = text(
+                "SELECT tasks.id, tasks.title, tasks.description, tasks.task_order, tasks.category_id, "
+                "ts_rank(tasks.search_vector, query) AS rank FROM tasks, websearch_to_tsquery('english', :q) AS query "
+                f"WHERE tasks.search_vector @@ query {category_filter} "
+                "ORDER BY rank DESC, tasks.id LIMIT :limit OFFSET :offset"
+            )
+        else:
+            # No full-text index on this backend; substring match keeps the endpoint usable
+            params["q"] = f"%{q}%"
+            statement = text(
+                "SELECT tasks.id, tasks.title, tasks.description, tasks.task_order, tasks.category_id, 0.0 AS rank "
+                f"FROM tasks WHERE (tasks.title LIKE :q OR tasks.description LIKE :q) {category_filter} "
+                "ORDER BY tasks.id LIMIT :limit OFFSET :offset"
+            )
+        rows = [dict(row._mapping) for row in db.execute(statement, params)]
+        next_offset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_offset = offset + limit
+        return {"items": rows, "next_offset": next_offset}
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def _invalidate_task(task_id: int, new_category_id: int):
+    """Drop a task and every cached category that may list it, without a query for its old category."""
+    cached = row_cache.peek(("task", task_id))
+    if cached is not None:
+        row_cache.invalidate(("task", task_id), ("category", cached.category_id), ("category", new_category_id))
+        return
+    row_cache.invalidate(("task", task_id), ("category", new_category_id))
+    row_cache.invalidate_matching(
+        lambda key, value: key[0] == "category" and any(task.id == task_id for task in value.tasks)
+    )
+
 def create_task(db: Session, task: TaskCreate, category_id: int):
-    logger.info(f"Creating task with title: {task.title} in category with ID: {category_id}")
+    logger.info("Creating task with title: %s in category with ID: %s", task.title, category_id)
     try:
-        db_task = Task(title=task.title, description=task.description, task_order=task.task_order, category_id=category_id)
-        db.add(db_task)
+        # INSERT ... SELECT from the live category: no row is inserted when it is missing or soft-deleted
+        values = task.model_dump()
+        source = select(
+            *(literal(value, Task.__table__.c[name].type) for name, value in values.items()), Category.id
+        ).where(Category.id == category_id, LIVE_CATEGORY)
+        statement = insert(Task).from_select([*values, "category_id"], source).returning(*TASK_COLUMNS)
+        row = db.execute(statement).first()
+        if row is None:
+            db.rollback()
+            logger.error("Category with ID %s not found", category_id)
+            raise HTTPException(status_code=404, detail="Category not found")
         db.commit()
-        db.refresh(db_task)
-        return db_task
+        board_version.bump()
+        row_cache.invalidate(("category", category_id))
+        event_bus.publish("task.created", task=dict(row._mapping))
+        return dict(row._mapping)
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.error("Category with ID %s not found: %s", category_id, e)
+        raise HTTPException(status_code=404, detail="Category not found")
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
     
+def _raise_if_category_missing(db: Session, task_id: int, category_id: int):
+    """After an update matched nothing: 404 for the category when the task itself is there to update."""
+    task_found = db.execute(select(Task.id).where(Task.id == task_id, LIVE_TASK)).first() is not None
+    if task_found and not db.execute(select(_live_category(category_id))).scalar():
+        logger.error("Category with ID %s not found", category_id)
+        raise HTTPException(status_code=404, detail="Category not found")
+
 def update_task(db: Session, task_id: int, task: TaskUpdate):
-    logger.info(f"Updating task with ID {task_id} to title: {task.title}")
+    logger.info("Updating task with ID %s to title: %s", task_id, task.title)
     try:
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
+        # One UPDATE ... RETURNING that matches nothing when the task or the target category is missing or hidden
+        statement = (
+            update(Task)
+            .where(Task.id == task_id, LIVE_TASK, _live_category(task.category_id))
+            .values(**task.model_dump())
+            .returning(*TASK_COLUMNS)
+        )
+        row = db.execute(statement, execution_options={"synchronize_session": False}).first()
+        if row is None:
+            db.rollback()
+            _raise_if_category_missing(db, task_id, task.category_id)
             return None
-        
-        # Check if the category_id exists
-        category = db.query(Category).filter(Category.id == task.category_id).first()
-        if not category:
-            logger.error(f"Category with ID {task.category_id} not found")
-            raise HTTPException(status_code=404, detail="Category not found")
-        
-        db_task.title = task.title
-        db_task.description = task.description
-        db_task.task_order = task.task_order
-        db_task.category_id = task.category_id
         db.commit()
-        db.refresh(db_task)
-        return db_task
+        board_version.bump()
+        _invalidate_task(task_id, task.category_id)
+        event_bus.publish("task.updated", task=dict(row._mapping))
+        return dict(row._mapping)
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.error("Category with ID %s not found: %s", task.category_id, e)
+        raise HTTPException(status_code=404, detail="Category not found")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+    
+def patch_task(db: Session, task_id: int, task: TaskPatch):
+    """Write only the fields sent; a patch that changes nothing issues no UPDATE and bumps nothing."""
+    changes = task.model_dump(exclude_none=True)
+    logger.info("Patching task with ID %s: %s", task_id, sorted(changes))
+    try:
+        if changes:
+            statement = _changed_only(Task, task_id, changes).where(LIVE_TASK)
+            if "category_id" in changes:
+                statement = statement.where(_live_category(changes["category_id"]))
+            row = db.execute(statement.returning(*TASK_COLUMNS), execution_options={"synchronize_session": False}).first()
+            if row is not None:
+                db.commit()
+                board_version.bump()
+                _invalidate_task(task_id, row.category_id)
+                event_bus.publish("task.updated", task=dict(row._mapping))
+                return dict(row._mapping)
+            db.rollback()
+            if "category_id" in changes:
+                _raise_if_category_missing(db, task_id, changes["category_id"])
+        # Nothing to write: either a no-op or an unknown id, which get_task_by_task_id reports as None
+        return get_task_by_task_id(db, task_id=task_id)
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.error("Category with ID %s not found: %s", task.category_id, e)
+        raise HTTPException(status_code=404, detail="Category not found")
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
     
 def delete_task(db: Session, task_id: int):
     try:
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            logger.error(f"Task with ID {task_id} not found for deletion")
+        logger.info("Deleting task with ID %s", task_id)
+        statement = delete(Task).where(Task.id == task_id, LIVE_TASK).returning(Task.category_id)
+        category_id = db.execute(statement, execution_options={"synchronize_session": False}).scalar()
+        if category_id is None:
+            db.rollback()
+            logger.error("Task with ID %s not found for deletion", task_id)
             return None
-        logger.info(f"Deleting task with ID {task_id}")
-        db.delete(db_task)
         db.commit()
-        logger.info(f"Task with ID {task_id} successfully deleted")
-        return {"message": f"Task with ID: {task_id} is deleted"}
+        board_version.bump()
+        row_cache.invalidate(("task", task_id), ("category", category_id))
+        event_bus.publish("task.deleted", id=task_id, category_id=category_id)
+        logger.info("Task with ID %s successfully deleted", task_id)
+        return {"id": task_id, "category_id": category_id, "message": f"Task with ID: {task_id} is deleted"}
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error occurred: {e}")
+        logger.error("Database error occurred: %s", e)
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"An unexpected error occurred: {e}")
-        raise
\ No newline at end of file
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+
+################################################################################################################
+##############################################  Bulk Tasks CRUD  ###############################################
+
+def _existing_ids(db: Session, model, ids, *filters):
+    ids = set(ids)
+    if not ids:
+        return set()
+    return {row.id for row in db.query(model.id).filter(model.id.in_(ids), *filters)}
+
+def bulk_create_tasks(db: Session, payload: TaskBulkCreate):
+    logger.info("Bulk creating %s tasks", len(payload.items))
+    try:
+        categories = _existing_ids(db, Category, (item.category_id for item in payload.items), LIVE_CATEGORY)
+        results, rows = [], []
+        for index, item in enumerate(payload.items):
+            if item.category_id not in categories:
+                results.append({"index": index, "status": "error", "detail": f"Category {item.category_id} not found"})
+                continue
+            results.append({"index": index, "status": "created"})
+            rows.append(item.model_dump())
+
+        if rows:
+            # One multi-row INSERT; ids come back in parameter order
+            new_ids = db.execute(insert(Task).returning(Task.id, sort_by_parameter_order=True), rows).scalars().all()
+            created = iter(new_ids)
+            for result in results:
+                if result["status"] == "created":
+                    result["id"] = next(created)
+        db.commit()
+        board_version.bump()
+        row_cache.invalidate(*(("category", category_id) for category_id in categories))
+        # Clients refetch after bulk changes rather than receiving up to BULK_MAX_ITEMS events
+        event_bus.publish("board.changed", reason="tasks.bulk_create")
+        return {"results": results}
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def bulk_update_tasks(db: Session, payload: TaskBulkUpdate):
+    logger.info("Bulk updating %s tasks", len(payload.items))
+    try:
+        old_categories = {
+            row.id: row.category_id
+            for row in db.query(Task.id, Task.category_id).filter(Task.id.in_({item.id for item in payload.items}), LIVE_TASK)
+        }
+        categories = _existing_ids(db, Category, (item.category_id for item in payload.items), LIVE_CATEGORY)
+        results, rows = [], []
+        for index, item in enumerate(payload.items):
+            if item.id not in old_categories:
+                results.append({"index": index, "id": item.id, "status": "error", "detail": "Task not found"})
+            elif item.category_id not in categories:
+                results.append({"index": index, "id": item.id, "status": "error", "detail": f"Category {item.category_id} not found"})
+            else:
+                results.append({"index": index, "id": item.id, "status": "updated"})
+                rows.append(item.model_dump())
+
+        if rows:
+            # ORM bulk UPDATE by primary key, sent as a single executemany
+            db.execute(update(Task), rows)
+        db.commit()
+        board_version.bump()
+        event_bus.publish("board.changed", reason="tasks.bulk_update")
+        row_cache.invalidate(
+            *(("task", row["id"]) for row in rows),
+            *(("category", old_categories[row["id"]]) for row in rows),
+            *(("category", row["category_id"]) for row in rows),
+        )
+        return {"results": results}
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+def bulk_delete_tasks(db: Session, payload: TaskBulkDelete):
+    logger.info("Bulk deleting %s tasks", len(payload.ids))
+    try:
+        deleted = {}
+        if payload.ids:
+            statement = delete(Task).where(Task.id.in_(set(payload.ids)), LIVE_TASK).returning(Task.id, Task.category_id)
+            deleted = {row.id: row.category_id for row in db.execute(statement, execution_options={"synchronize_session": False})}
+        db.commit()
+        board_version.bump()
+        event_bus.publish("board.changed", reason="tasks.bulk_delete")
+        row_cache.invalidate(*(("task", task_id) for task_id in deleted), *(("category", category_id) for category_id in deleted.values()))
+        results = [
+            {"index": index, "id": task_id, "status": "deleted"}
+            if task_id in deleted
+            else {"index": index, "id": task_id, "status": "error", "detail": "Task not found"}
+            for index, task_id in enumerate(payload.ids)
+        ]
+        return {"results": results}
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+
+################################################################################################################
+###############################################  Reorder CRUD  #################################################
+
+def _gap_order(db: Session, model, order_column, filters, moved_id: int, after_id):
+    """Order key placing ``moved_id`` right after ``after_id`` (or first when None).
+
+    Returns None when the neighbours are adjacent and the column needs rebalancing.
+    Raises LookupError when ``after_id`` is not in the same column.
+    """
+    siblings = db.query(model.id, order_column.label("order")).filter(*filters, model.id != moved_id)
+    if after_id is None:
+        lower = None
+        upper = siblings.order_by(order_column.asc(), model.id.asc()).first()
+    else:
+        anchor = siblings.filter(model.id == after_id).first()
+        if anchor is None:
+            raise LookupError(after_id)
+        lower = anchor.order
+        upper = (
+            siblings.filter(or_(order_column > lower, and_(order_column == lower, model.id > after_id)))
+            .order_by(order_column.asc(), model.id.asc())
+            .first()
+        )
+
+    if lower is None and upper is None:
+        return ORDER_GAP
+    if lower is None:
+        return upper.order - ORDER_GAP
+    if upper is None:
+        return lower + ORDER_GAP
+    if upper.order - lower > 1:
+        return (lower + upper.order) // 2
+    return None
+
+def _rebalance(db: Session, model, order_column, filters):
+    logger.info("Rebalancing %s order keys", model.__tablename__)
+    ids = [row.id for row in db.query(model.id).filter(*filters).order_by(order_column.asc(), model.id.asc())]
+    db.bulk_update_mappings(model, [{"id": id_, order_column.key: (index + 1) * ORDER_GAP} for index, id_ in enumerate(ids)])
+    db.flush()
+    return ids
+
+def _move(db: Session, model, order_column, filters, moved_id: int, after_id, touched: set, rebalanced: set):
+    new_order = _gap_order(db, model, order_column, filters, moved_id, after_id)
+    if new_order is None:
+        cache_kind = "task" if model is Task else "category"
+        touched.update((cache_kind, id_) for id_ in _rebalance(db, model, order_column, filters))
+        rebalanced.add(cache_kind)
+        new_order = _gap_order(db, model, order_column, filters, moved_id, after_id)
+    return new_order
+
+def move_task(db: Session, task_id: int, category_id: int, after_id=None, touched: set = None, rebalanced: set = None):
+    logger.info("Moving task with ID %s to category %s after task %s", task_id, category_id, after_id)
+    db_task = db.query(Task).filter(Task.id == task_id, LIVE_TASK).first()
+    if not db_task:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    if not db.query(Category.id).filter(Category.id == category_id, LIVE_CATEGORY).first():
+        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
+    touched = set() if touched is None else touched
+    rebalanced = set() if rebalanced is None else rebalanced
+    touched.update({("task", task_id), ("category", db_task.category_id), ("category", category_id)})
+    try:
+        new_order = _move(db, Task, Task.task_order, [Task.category_id == category_id], task_id, after_id, touched, rebalanced)
+    except LookupError:
+        raise HTTPException(status_code=404, detail=f"Task {after_id} not found in category {category_id}")
+    db_task.category_id = category_id
+    db_task.task_order = new_order
+    db.flush()
+    return db_task
+
+def move_category(db: Session, category_id: int, after_id=None, touched: set = None, rebalanced: set = None):
+    logger.info("Moving category with ID %s after category %s", category_id, after_id)
+    db_category = db.query(Category).filter(Category.id == category_id, LIVE_CATEGORY).first()
+    if not db_category:
+        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
+    touched = set() if touched is None else touched
+    rebalanced = set() if rebalanced is None else rebalanced
+    touched.add(("category", category_id))
+    try:
+        new_order = _move(db, Category, Category.category_order, [], category_id, after_id, touched, rebalanced)
+    except LookupError:
+        raise HTTPException(status_code=404, detail=f"Category {after_id} not found")
+    db_category.category_order = new_order
+    db.flush()
+    return db_category
+
+def reorder(db: Session, moves: ReorderRequest):
+    logger.info("Applying %s category moves and %s task moves", len(moves.categories), len(moves.tasks))
+    try:
+        # Cache keys to invalidate, and the kinds ("task", "category") whose order keys were renumbered
+        touched, rebalanced = set(), set()
+        categories = [move_category(db, move.category_id, move.after_id, touched, rebalanced) for move in moves.categories]
+        tasks = [move_task(db, move.task_id, move.category_id, move.after_id, touched, rebalanced) for move in moves.tasks]
+        db.commit()
+        board_version.bump()
+        row_cache.invalidate(*touched)
+        for db_category in categories:
+            event_bus.publish("category.moved", id=db_category.id, category_order=db_category.category_order)
+        for db_task in tasks:
+            event_bus.publish("task.moved", id=db_task.id, category_id=db_task.category_id, task_order=db_task.task_order)
+        if rebalanced:
+            # Sibling order keys were renumbered too; clients must refetch to see them
+            event_bus.publish("board.changed", reason="rebalance")
+        return {"categories": categories, "tasks": tasks}
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+
+################################################################################################################
+################################################  Export CRUD  #################################################
+
+EXPORT_CSV_FIELDS = ["type", "id", "name", "category_order", "title", "description", "task_order", "category_id"]
+EXPORT_BATCH_SIZE = 1000
+
+def _export_rows(db: Session):
+    """Every category then every task as plain dicts, read through a server-side cursor."""
+    categories = db.execute(
+        select(*CATEGORY_COLUMNS).where(LIVE_CATEGORY).order_by(Category.category_order.asc(), Category.id.asc()),
+        execution_options={"yield_per": EXPORT_BATCH_SIZE},
+    )
+    for partition in categories.partitions():
+        yield [{"type": "category", **row._mapping} for row in partition]
+    tasks = db.execute(
+        select(*TASK_COLUMNS).where(LIVE_TASK).order_by(Task.category_id.asc(), Task.task_order.asc(), Task.id.asc()),
+        execution_options={"yield_per": EXPORT_BATCH_SIZE},
+    )
+    for partition in tasks.partitions():
+        yield [{"type": "task", **row._mapping} for row in partition]
+
+def export_board(db: Session, format: str = "ndjson"):
+    """Yield the board as text chunks of up to EXPORT_BATCH_SIZE rows; memory stays flat in the row count."""
+    logger.info("Exporting board as %s", format)
+    try:
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS)
+            writer.writeheader()
+            for batch in _export_rows(db):
+                writer.writerows(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for batch in _export_rows(db):
+                yield "".join(json.dumps(row) + "\n" for row in batch)
+    except SQLAlchemyError as e:
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+
+
+################################################################################################################
+################################################  Import CRUD  #################################################
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 1000
+# CSV columns each row type uses; an empty cell in any other column is just padding
+IMPORT_CSV_COLUMNS = {
+    "category": {"type", "id", "name", "category_order"},
+    "task": {"type", "id", "title", "description", "task_order", "category_id"},
+}
+
+class _BoardImport:
+    """Buffers parsed rows and writes them in IMPORT_BATCH_SIZE chunks, one commit per chunk.
+
+    Category ids in the file are source ids: tasks that reference them are re-pointed at the
+    newly created categories, any other category_id must already exist in the database.
+    Tasks that reference a category row which failed to import are reported as errors,
+    never attached to an unrelated local category that happens to share its id.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.category_ids = {}
+        self.failed_category_ids = set()
+        self.categories = []
+        self.tasks = []
+        self.touched_categories = set()
+        self.lines = 0
+        self.committed = False
+        self.categories_created = 0
+        self.tasks_created = 0
+        self.error_count = 0
+        self.errors = []
+
+    def error(self, line: int, detail: str):
+        self.error_count += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "detail": detail})
+
+    @staticmethod
+    def _source_id(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _describe(e: Exception) -> str:
+        if isinstance(e, ValidationError):
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            return f"{field}: {error['msg']}" if field else error["msg"]
+        if isinstance(e, KeyError):
+            return f"{e.args[0]}: Field required"
+        return str(e)
+
+    def _category_failed(self, source_id):
+        if source_id is not None:
+            self.failed_category_ids.add(source_id)
+            self.category_ids.pop(source_id, None)
+
+    def add(self, line: int, row: dict):
+        self.lines += 1
+        kind = row.get("type")
+        if kind == "category":
+            # Remembered before validation so a rejected row still claims its source id
+            source_id = self._source_id(row.get("id"))
+        try:
+            if kind == "category":
+                payload = CategoryCreate.model_validate(row)
+                self.categories.append((line, source_id, payload.model_dump()))
+            elif kind == "task":
+                payload = TaskCreate.model_validate(row)
+                category_id = int(row["category_id"])
+                # A task may point at a category from earlier in the file; write those first
+                if self.categories:
+                    self.flush_categories()
+                if category_id in self.failed_category_ids:
+                    self.error(line, f"Category {category_id} from this file was not imported")
+                    return
+                self.tasks.append((line, {**payload.model_dump(), "category_id": self.category_ids.get(category_id, category_id)}))
+            else:
+                self.error(line, f"Unknown row type: {kind!r}")
+        except (ValidationError, KeyError, TypeError, ValueError) as e:
+            if kind == "category":
+                self._category_failed(source_id)
+            self.error(line, self._describe(e))
+        if len(self.categories) >= IMPORT_BATCH_SIZE:
+            self.flush_categories()
+        if len(self.tasks) >= IMPORT_BATCH_SIZE:
+            self.flush_tasks()
+
+    def _insert(self, statement, batch):
+        """Insert the whole batch in a savepoint; on a constraint error fall back to row by row."""
+        try:
+            with self.db.begin_nested():
+                return list(self.db.execute(statement, [values for _, values in batch]))
+        except IntegrityError:
+            rows = []
+            for line, values in batch:
+                try:
+                    with self.db.begin_nested():
+                        rows.extend(self.db.execute(statement, [values]))
+                except IntegrityError as e:
+                    self.error(line, str(e.orig))
+                    rows.append(None)
+            return rows
+
+    def flush_categories(self):
+        batch, self.categories = self.categories, []
+        if not batch:
+            return
+        statement = insert(Category).returning(Category.id, sort_by_parameter_order=True)
+        rows = self._insert(statement, [(line, values) for line, _, values in batch])
+        for (line, source_id, _), row in zip(batch, rows):
+            if row is None:
+                self._category_failed(source_id)
+                continue
+            self.categories_created += 1
+            if source_id is not None:
+                self.category_ids[source_id] = row.id
+                self.failed_category_ids.discard(source_id)
+        self.db.commit()
+        self.committed = True
+        logger.info("Import progress: %s lines, %s categories created", self.lines, self.categories_created)
+
+    def flush_tasks(self):
+        batch, self.tasks = self.tasks, []
+        if not batch:
+            return
+        statement = insert(Task).returning(Task.category_id)
+        rows = self._insert(statement, batch)
+        created = [row for row in rows if row is not None]
+        self.tasks_created += len(created)
+        self.touched_categories.update(row.category_id for row in created)
+        self.db.commit()
+        self.committed = True
+        logger.info("Import progress: %s lines, %s tasks created", self.lines, self.tasks_created)
+
+    def announce(self):
+        """Tell readers about the committed chunks; also runs when the import fails partway."""
+        board_version.bump()
+        event_bus.publish("board.changed", reason="import")
+        row_cache.invalidate(*(("category", category_id) for category_id in self.touched_categories))
+
+    def finish(self):
+        self.flush_categories()
+        self.flush_tasks()
+        return {
+            "lines": self.lines,
+            "categories_created": self.categories_created,
+            "tasks_created": self.tasks_created,
+            "error_count": self.error_count,
+            "errors": sorted(self.errors, key=lambda error: error["line"]),
+        }
+
+def import_board(db: Session, stream, format: str = "ndjson"):
+    """Import categories and tasks from a text stream in the /v1/export format, reading it line by line."""
+    logger.info("Importing board from %s", format)
+    board_import = _BoardImport(db)
+    try:
+        if format == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                columns = IMPORT_CSV_COLUMNS.get(row.get("type"), row.keys())
+                board_import.add(reader.line_num, {key: value for key, value in row.items() if value != "" or key in columns})
+        else:
+            for line_number, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    board_import.lines += 1
+                    board_import.error(line_number, f"Invalid JSON: {e}")
+                    continue
+                if not isinstance(row, dict):
+                    board_import.lines += 1
+                    board_import.error(line_number, "Expected a JSON object")
+                    continue
+                board_import.add(line_number, row)
+        return board_import.finish()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error occurred: %s", e)
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("An unexpected error occurred: %s", e)
+        raise
+    finally:
+        # Chunks are committed as they go, so a failure can still leave rows behind
+        if board_import.committed:
+            board_import.announce()
@@ -1,23 +1,99 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 class Category(Base):
     __tablename__ = "categories"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
-    category_order = Column(Integer, index=True, nullable=False)
-    tasks = relationship("Task", back_populates="category", cascade="all, delete")
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    category_order = Column(Integer, nullable=False)
+    # Maintained by the TASK_COUNT_* triggers below on SQLite and PostgreSQL
+    task_count = Column(Integer, nullable=False, server_default="0")
+    # Set by a soft delete; the category is hidden until its tasks are purged and the row is removed
+    deleted_at = Column(DateTime, nullable=True)
+    # category_id leads so selectinload's IN query reads ix_tasks_category_id_task_order in order instead of sorting.
+    # passive_deletes leaves tasks to ON DELETE CASCADE instead of loading and deleting them one by one.
+    tasks = relationship("Task", back_populates="category", cascade="all, delete", passive_deletes=True,
+                         order_by="[Task.category_id, Task.task_order, Task.id]")
+
+    # Board order and keyset pages; see alembic revision 7c1e4a9b2d60 for the index layout.
+    # deleted_at is indexed for the "hidden categories" lookup every task read makes, and leads
+    # the board order index so live categories are read in order without statistics (5d1f8b3e9c27).
+    __table_args__ = (
+        Index("ix_categories_category_order_id", "category_order", "id"),
+        Index("ix_categories_deleted_at", "deleted_at"),
+        Index("ix_categories_deleted_at_category_order_id", "deleted_at", "category_order", "id"),
+    )
     
     
 class Task(Base):
     __tablename__ = "tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    description = Column(String, index=True)
-    task_order = Column(Integer, index=True)
-    category_id = Column(Integer, ForeignKey("categories.id"))
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    description = Column(String)
+    task_order = Column(Integer)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"))
     category = relationship("Category", back_populates="tasks")
 
+    # Every task read filters on category_id and orders by task_order
+    __table_args__ = (Index("ix_tasks_category_id_task_order", "category_id", "task_order"),)
+
+
+# Full-text search over title and description, kept in sync by the database itself.
+# Mirrors alembic revision 3f2b9c1d7a4e so create_all builds the same schema.
+TASKS_FTS_SQLITE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+]
+TASKS_FTS_POSTGRESQL = [
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (search_vector)",
+]
+
+for statement in TASKS_FTS_SQLITE:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in TASKS_FTS_POSTGRESQL:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+# Per-category task counter behind GET /v1/categories/summary.
+# Mirrors alembic revision a4d8e2f61b37 so create_all builds the same schema.
+TASK_COUNT_SQLITE = [
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_ai AFTER INSERT ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_ad AFTER DELETE ON tasks BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_au AFTER UPDATE OF category_id ON tasks "
+    "WHEN old.category_id IS NOT new.category_id BEGIN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = old.category_id; "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = new.category_id; END",
+]
+TASK_COUNT_POSTGRESQL = [
+    "CREATE OR REPLACE FUNCTION tasks_count_sync() RETURNS trigger AS $$ BEGIN "
+    "IF TG_OP IN ('DELETE', 'UPDATE') THEN "
+    "UPDATE categories SET task_count = task_count - 1 WHERE id = OLD.category_id; END IF; "
+    "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+    "UPDATE categories SET task_count = task_count + 1 WHERE id = NEW.category_id; END IF; "
+    "RETURN NULL; END $$ LANGUAGE plpgsql",
+    "CREATE TRIGGER tasks_count_insert_delete AFTER INSERT OR DELETE ON tasks "
+    "FOR EACH ROW EXECUTE FUNCTION tasks_count_sync()",
+    "CREATE TRIGGER tasks_count_move AFTER UPDATE OF category_id ON tasks "
+    "FOR EACH ROW WHEN (OLD.category_id IS DISTINCT FROM NEW.category_id) EXECUTE FUNCTION tasks_count_sync()",
+]
+# Dialects that keep task_count current; the rest count with GROUP BY
+TASK_COUNT_DIALECTS = ("sqlite", "postgresql")
+
+for statement in TASK_COUNT_SQLITE:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in TASK_COUNT_POSTGRESQL:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
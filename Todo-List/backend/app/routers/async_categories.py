@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from app.schemas import Category as CategorySchema, CategoryCreate, CategoryPage
+from app.async_crud import get_categories, get_categories_page, get_category, create_category, update_category, delete_category
+from app.core.dependencies import get_async_db
+from app.core.purge import category_purger
+from app.core.versioning import board_version
+from app.routers.categories import purge_step
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Async twin of routers/categories.py, mounted instead of it when USE_ASYNC_DB is enabled;
+# routes without a twin here are served by the sync router (see main.sync_fallback)
+router = APIRouter()
+
+
+@router.get("/categories/", response_model=List[CategorySchema])
+async def read_categories(request: Request, response: Response, skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to fetch categories with skip=%s and limit=%s", skip, limit)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        return await get_categories(db, skip=skip, limit=limit)
+    except SQLAlchemyError as e:
+        logger.error("Error fetching categories: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error fetching categories: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.get("/categories/page", response_model=CategoryPage)
+async def read_categories_page(request: Request, response: Response, cursor: Optional[str] = None, limit: int = Query(10, ge=1, le=500), db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to fetch categories page after cursor=%s and limit=%s", cursor, limit)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        return await get_categories_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        logger.error("Invalid cursor for categories page: %s", e)
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except SQLAlchemyError as e:
+        logger.error("Error fetching categories page: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error fetching categories page: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.get("/categories/{category_id}", response_model=CategorySchema)
+async def read_category(category_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to fetch category with ID: %s", category_id)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    db_category = await get_category(db, category_id=category_id)
+    if db_category is None:
+        logger.error("Category with ID %s not found", category_id)
+        raise HTTPException(status_code=404, detail="Category not found")
+    return db_category
+
+
+@router.post("/categories/", response_model=CategorySchema)
+async def create_category_endpoint(category: CategoryCreate, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to create category with name: %s", category.name)
+    try:
+        return await create_category(db=db, category=category)
+    except SQLAlchemyError as e:
+        logger.error("Error creating category: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error creating category: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.put("/categories/{category_id}", response_model=CategorySchema)
+async def update_category_endpoint(category_id: int, category: CategoryCreate, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to update category with ID: %s", category_id)
+    db_category = await update_category(db=db, category_id=category_id, category=category)
+    if db_category is None:
+        logger.error("Category with ID %s not found for update", category_id)
+        raise HTTPException(status_code=404, detail="Category not found")
+    return db_category
+
+
+@router.delete("/categories/{category_id}")
+async def delete_category_endpoint(category_id: int, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Request to delete category with ID: %s", category_id)
+    delete_result = await delete_category(db, category_id=category_id, soft_delete_min_tasks=category_purger.min_tasks)
+    if delete_result is None:
+        logger.error("Category with ID %s not found for deletion", category_id)
+        raise HTTPException(status_code=404, detail="Category not found")
+    if delete_result["purge_pending"]:
+        # The purge thread works through the sync engine, which async mode keeps for its fallback routes
+        category_purger.start(purge_step)
+    return delete_result
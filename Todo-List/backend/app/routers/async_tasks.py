@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import Task as TaskSchema, TaskCreate, TaskUpdate
+from app.async_crud import create_task, get_task_by_task_id, get_category, update_task, delete_task
+from app.core.dependencies import get_async_db
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Async twin of routers/tasks.py, mounted instead of it when USE_ASYNC_DB is enabled;
+# routes without a twin here are served by the sync router (see main.sync_fallback)
+router = APIRouter()
+
+
+@router.get("/tasks/{task_id}", response_model=TaskSchema)
+async def get_task_endpint(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_task = await get_task_by_task_id(db, task_id=task_id)
+    if db_task is None:
+        logger.error("Task with ID %s not found", task_id)
+        raise HTTPException(status_code=404, detail="Task not found")
+    return db_task
+
+
+@router.post("/categories/{category_id}/tasks/", response_model=TaskSchema)
+async def create_task_endpoint(category_id: int, task: TaskCreate, db: AsyncSession = Depends(get_async_db)):
+    db_category = await get_category(db, category_id=category_id)
+    if db_category is None:
+        logger.error("Category with ID %s not found", category_id)
+        raise HTTPException(status_code=404, detail="Category Not Found")
+    return await create_task(db, task, category_id=category_id)
+
+
+@router.put("/tasks/{task_id}", response_model=TaskSchema)
+async def update_task_endpoint(task_id: int, task: TaskUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_task = await update_task(db, task_id=task_id, task=task)
+    if db_task is None:
+        logger.error("Task with ID %s not found", task_id)
+        raise HTTPException(status_code=404, detail="Task not found")
+    return db_task
+
+
+@router.delete("/tasks/{task_id}")
+async def delete_task_endpoint(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_task = await get_task_by_task_id(db, task_id=task_id)
+    if db_task is None:
+        logger.error("Task with ID %s not found", task_id)
+        raise HTTPException(status_code=404, detail="Task not found")
+    category_id = db_task.category_id
+
+    delete_result = await delete_task(db, task_id=task_id)
+    if delete_result is None:
+        raise HTTPException(status_code=404, detail="Task not found for deletion")
+
+    return {"id": task_id, "category_id": category_id, "message": delete_result["message"]}
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from app.schemas import Board as BoardSchema, ReorderRequest, ReorderResult
+from app.crud import get_board, reorder
+from app.core.dependencies import get_db, get_read_db
+from app.core.versioning import board_version
+from app.core.serialization import FAST_SERIALIZATION, fast_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter()
+
+
+@router.get("/board", response_model=BoardSchema)
+def read_board(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    logger.info("Request to fetch board snapshot")
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        if FAST_SERIALIZATION:
+            return fast_response({"categories": get_board(db, as_dicts=True)}, response)
+        categories = get_board(db)
+        return {"categories": categories}
+    except SQLAlchemyError as e:
+        logger.error("Error fetching board: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error fetching board: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.post("/reorder", response_model=ReorderResult)
+def reorder_endpoint(moves: ReorderRequest, db: Session = Depends(get_db)):
+    logger.info("Request to reorder %s categories and %s tasks", len(moves.categories), len(moves.tasks))
+    try:
+        return reorder(db, moves)
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.error("Error applying reorder: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error applying reorder: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
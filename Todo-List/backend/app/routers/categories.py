@@ -1,72 +1,138 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from app.schemas import Category as CategorySchema, CategoryCreate
-from app.crud import get_categories, get_category, create_category, update_category, delete_category
-from app.core.dependencies import get_db
-from typing import List
+from app.schemas import Category as CategorySchema, CategoryCreate, CategoryPatch, CategoryPage, CategorySummary
+from app.crud import get_categories, get_categories_page, get_category_summary, get_category, create_category, update_category, patch_category, delete_category, purge_deleted_categories
+from app.core.database import SessionLocal, get_engine
+from app.core.dependencies import get_db, get_read_db
+from app.core.purge import category_purger
+from app.core.versioning import board_version
+from app.core.serialization import FAST_SERIALIZATION, fast_response
+from typing import List, Optional
 import logging
 
-logging.basicConfig(filename='app.log', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 router = APIRouter()
 
 
+def purge_step():
+    # Runs on the purge thread, outside any request, so it owns its session
+    db = SessionLocal(bind=get_engine())
+    try:
+        return purge_deleted_categories(db, batch_size=category_purger.batch_size)
+    finally:
+        db.close()
+
+
 @router.get("/categories/", response_model=List[CategorySchema])
-def read_categories(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    logger.info(f"Request to fetch categories with skip={
-                skip} and limit={limit}")
+def read_categories(request: Request, response: Response, skip: int = 0, limit: int = 10, db: Session = Depends(get_read_db)):
+    logger.info("Request to fetch categories with skip=%s and limit=%s", skip, limit)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
     try:
+        if FAST_SERIALIZATION:
+            return fast_response(get_categories(db, skip=skip, limit=limit, as_dicts=True), response)
         categories = get_categories(db, skip=skip, limit=limit)
         return categories
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching categories: {e}")
+        logger.error("Error fetching categories: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error fetching categories: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.get("/categories/page", response_model=CategoryPage)
+def read_categories_page(request: Request, response: Response, cursor: Optional[str] = None, limit: int = Query(10, ge=1, le=500), db: Session = Depends(get_read_db)):
+    logger.info("Request to fetch categories page after cursor=%s and limit=%s", cursor, limit)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        if FAST_SERIALIZATION:
+            return fast_response(get_categories_page(db, cursor=cursor, limit=limit, as_dicts=True), response)
+        return get_categories_page(db, cursor=cursor, limit=limit)
+    except ValueError as e:
+        logger.error("Invalid cursor for categories page: %s", e)
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except SQLAlchemyError as e:
+        logger.error("Error fetching categories page: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error("Unexpected error fetching categories page: %s", e)
+        raise HTTPException(status_code=500, detail="Server error")
+
+
+@router.get("/categories/summary", response_model=List[CategorySummary])
+def read_category_summary(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    logger.info("Request to fetch category summary")
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        if FAST_SERIALIZATION:
+            return fast_response(get_category_summary(db), response)
+        return get_category_summary(db)
+    except SQLAlchemyError as e:
+        logger.error("Error fetching category summary: %s", e)
         raise HTTPException(status_code=500, detail="Database error")
     except Exception as e:
-        logger.error(f"Unexpected error fetching categories: {e}")
+        logger.error("Unexpected error fetching category summary: %s", e)
         raise HTTPException(status_code=500, detail="Server error")
 
 
 @router.get("/categories/{category_id}", response_model=CategorySchema)
-def read_category(category_id: int, db: Session = Depends(get_db)):
-    logger.info(f"Request to fetch category with ID: {category_id}")
+def read_category(category_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
+    logger.info("Request to fetch category with ID: %s", category_id)
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
     db_category = get_category(db, category_id=category_id)
     if db_category is None:
-        logger.error(f"Category with ID {category_id} not found")
+        logger.error("Category with ID %s not found", category_id)
         raise HTTPException(status_code=404, detail="Category not found")
     return db_category
 
 
 @router.post("/categories/", response_model=CategorySchema)
 def create_category_endpoint(category: CategoryCreate, db: Session = Depends(get_db)):
-    logger.info(f"Request to create category with name: {category.name}")
+    logger.info("Request to create category with name: %s", category.name)
     try:
         return create_category(db=db, category=category)
     except SQLAlchemyError as e:
-        logger.error(f"Error creating category: {e}")
+        logger.error("Error creating category: %s", e)
         raise HTTPException(status_code=500, detail="Database error")
     except Exception as e:
-        logger.error(f"Unexpected error creating category: {e}")
+        logger.error("Unexpected error creating category: %s", e)
         raise HTTPException(status_code=500, detail="Server error")
 
 
 @router.put("/categories/{category_id}", response_model=CategorySchema)
 def update_category_endpoint(category_id: int, category: CategoryCreate, db: Session = Depends(get_db)):
-    logger.info(f"Request to update category with ID: {category_id}")
-    db_category = get_category(db, category_id=category_id)
+    logger.info("Request to update category with ID: %s", category_id)
+    db_category = update_category(db=db, category_id=category_id, category=category)
     if db_category is None:
-        logger.error(f"Category with ID {category_id} not found for update")
+        logger.error("Category with ID %s not found for update", category_id)
         raise HTTPException(status_code=404, detail="Category not found")
-    return update_category(db=db, category_id=category_id, category=category)
+    return db_category
+
+
+@router.patch("/categories/{category_id}", response_model=CategorySchema)
+def patch_category_endpoint(category_id: int, category: CategoryPatch, db: Session = Depends(get_db)):
+    logger.info("Request to patch category with ID: %s", category_id)
+    db_category = patch_category(db=db, category_id=category_id, category=category)
+    if db_category is None:
+        logger.error("Category with ID %s not found for update", category_id)
+        raise HTTPException(status_code=404, detail="Category not found")
+    return db_category
 
 
 @router.delete("/categories/{category_id}")
 def delete_category_endpoint(category_id: int, db: Session = Depends(get_db)):
-    logger.info(f"Request to delete category with ID: {category_id}")
-    db_category = get_category(db, category_id=category_id)
-    if db_category is None:
-        logger.error(f"Category with ID {category_id} not found for deletion")
+    logger.info("Request to delete category with ID: %s", category_id)
+    delete_result = delete_category(db, category_id=category_id, soft_delete_min_tasks=category_purger.min_tasks)
+    if delete_result is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    return delete_category(db, category_id=category_id)
+    if delete_result["purge_pending"]:
+        # Not a BackgroundTask: that would hold this request's admission slot until the purge ends
+        category_purger.start(purge_step)
+    return delete_result
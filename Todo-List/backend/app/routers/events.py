@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from app.core.events import event_bus
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter()
+
+# Comment line sent when idle so proxies keep the connection open and disconnects are noticed
+HEARTBEAT_SECONDS = 15
+
+
+async def _event_stream(request: Request):
+    subscription = event_bus.subscribe()
+    logger.info("Event stream opened, %s subscribers", event_bus.subscriber_count())
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+    finally:
+        event_bus.unsubscribe(subscription)
+        logger.info("Event stream closed, %s dropped for overflow", subscription.overflowed)
+
+
+@router.get("/events")
+async def events_endpoint(request: Request):
+    """Server-sent events for every committed change to categories and tasks."""
+    return StreamingResponse(
+        _event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
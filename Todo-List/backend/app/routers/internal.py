@@ -0,0 +1,46 @@
+from fastapi import APIRouter
+from app.core.database import get_pool_status
+from app.core.cache import row_cache
+from app.core.events import event_bus
+from app.core.admission import admission_gates
+from app.core.replica import replica_router
+from app.core.purge import category_purger
+from app.core.logging_config import logging_stats
+
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def read_pool_status():
+    return get_pool_status()
+
+
+@router.get("/cache")
+def read_cache_stats():
+    return row_cache.stats()
+
+
+@router.get("/events")
+def read_event_stats():
+    return {"subscribers": event_bus.subscriber_count()}
+
+
+@router.get("/admission")
+def read_admission_stats():
+    return {name: gate.stats() for name, gate in admission_gates.items()}
+
+
+@router.get("/replica")
+def read_replica_status():
+    return replica_router.stats()
+
+
+@router.get("/purge")
+def read_purge_status():
+    return category_purger.stats()
+
+
+@router.get("/logging")
+def read_logging_status():
+    return logging_stats()
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.metrics import render_metrics
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
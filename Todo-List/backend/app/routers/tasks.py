@@ -1,54 +1,112 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.schemas import Task as TaskSchema, TaskCreate, TaskUpdate
-from app.crud import create_task, get_task_by_task_id, get_category, update_task, delete_task
-from app.core.dependencies import get_db
+from sqlalchemy.exc import SQLAlchemyError
+from app.schemas import Task as TaskSchema, TaskCreate, TaskUpdate, TaskPatch, TaskPage, TaskSearchPage, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, BulkResult
+from app.crud import create_task, get_task_by_task_id, get_tasks_page, search_tasks, update_task, patch_task, delete_task, bulk_create_tasks, bulk_update_tasks, bulk_delete_tasks
+from app.core.dependencies import get_db, get_read_db
+from app.core.versioning import board_version
+from app.core.serialization import FAST_SERIALIZATION, fast_response
+from typing import Optional
 import logging
 
-logging.basicConfig(filename='app.log', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 router = APIRouter()
 
 
+# Declared before /tasks/{task_id} so "bulk" is not parsed as a task id
+@router.post("/tasks/bulk", response_model=BulkResult)
+def bulk_create_tasks_endpoint(payload: TaskBulkCreate, db: Session = Depends(get_db)):
+    logger.info("Request to bulk create %s tasks", len(payload.items))
+    try:
+        return bulk_create_tasks(db, payload)
+    except SQLAlchemyError as e:
+        logger.error("Error bulk creating tasks: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+@router.put("/tasks/bulk", response_model=BulkResult)
+def bulk_update_tasks_endpoint(payload: TaskBulkUpdate, db: Session = Depends(get_db)):
+    logger.info("Request to bulk update %s tasks", len(payload.items))
+    try:
+        return bulk_update_tasks(db, payload)
+    except SQLAlchemyError as e:
+        logger.error("Error bulk updating tasks: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+@router.post("/tasks/bulk/delete", response_model=BulkResult)
+def bulk_delete_tasks_endpoint(payload: TaskBulkDelete, db: Session = Depends(get_db)):
+    logger.info("Request to bulk delete %s tasks", len(payload.ids))
+    try:
+        return bulk_delete_tasks(db, payload)
+    except SQLAlchemyError as e:
+        logger.error("Error bulk deleting tasks: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+@router.get("/tasks/search", response_model=TaskSearchPage)
+def search_tasks_endpoint(q: str = Query(..., min_length=1, max_length=200), category_id: Optional[int] = None,
+                          limit: int = Query(20, ge=1, le=100), offset: int = Query(0, ge=0, le=10000),
+                          db: Session = Depends(get_read_db)):
+    logger.info("Request to search tasks for q=%r", q)
+    try:
+        return search_tasks(db, q=q, category_id=category_id, limit=limit, offset=offset)
+    except SQLAlchemyError as e:
+        logger.error("Error searching tasks: %s", e)
+        raise HTTPException(status_code=500, detail="Database error")
+
+
 @router.get("/tasks/{task_id}", response_model=TaskSchema)
-def get_task_endpint(task_id: int, db: Session = Depends(get_db)):
+def get_task_endpint(task_id: int, db: Session = Depends(get_read_db)):
     db_task = get_task_by_task_id(db, task_id=task_id)
     if db_task is None:
-        logger.error(f"Task with ID {task_id} not found")
+        logger.error("Task with ID %s not found", task_id)
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
 
 
+@router.get("/categories/{category_id}/tasks/", response_model=TaskPage)
+def read_tasks_page(category_id: int, request: Request, response: Response, cursor: Optional[str] = None, limit: int = Query(50, ge=1, le=500), db: Session = Depends(get_read_db)):
+    if board_version.not_modified(request, response):
+        return board_version.not_modified_response(response)
+    try:
+        if FAST_SERIALIZATION:
+            return fast_response(get_tasks_page(db, category_id=category_id, cursor=cursor, limit=limit, as_dicts=True), response)
+        return get_tasks_page(db, category_id=category_id, cursor=cursor, limit=limit)
+    except ValueError as e:
+        logger.error("Invalid cursor for tasks page: %s", e)
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.post("/categories/{category_id}/tasks/", response_model=TaskSchema)
 def create_task_endpoint(category_id: int, task: TaskCreate, db: Session = Depends(get_db)):
-    db_category = get_category(db, category_id=category_id)
-    if db_category is None:
-        logger.error(f"Category with ID {category_id} not found")
-        raise HTTPException(status_code=404, detail="Category Not Found")
     return create_task(db, task, category_id=category_id)
 
 
 @router.put("/tasks/{task_id}", response_model=TaskSchema)
 def update_task_endpoint(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
-    db_task = get_task_by_task_id(db, task_id=task_id)
+    db_task = update_task(db, task_id=task_id, task=task)
     if db_task is None:
-        logger.error(f"Task with ID {task_id} not found")
+        logger.error("Task with ID %s not found", task_id)
         raise HTTPException(status_code=404, detail="Task not found")
-    return update_task(db, task_id=task_id, task=task)
+    return db_task
 
 
-@router.delete("/tasks/{task_id}")
-def delete_task_endpoint(task_id: int, db: Session = Depends(get_db)):
-    db_task = get_task_by_task_id(db, task_id=task_id)
+@router.patch("/tasks/{task_id}", response_model=TaskSchema)
+def patch_task_endpoint(task_id: int, task: TaskPatch, db: Session = Depends(get_db)):
+    db_task = patch_task(db, task_id=task_id, task=task)
     if db_task is None:
-        logger.error(f"Task with ID {task_id} not found")
+        logger.error("Task with ID %s not found", task_id)
         raise HTTPException(status_code=404, detail="Task not found")
-    category_id = db_task.category_id
-    
+    return db_task
+
+
+@router.delete("/tasks/{task_id}")
+def delete_task_endpoint(task_id: int, db: Session = Depends(get_db)):
     delete_result = delete_task(db, task_id=task_id)
     if delete_result is None:
-        raise HTTPException(status_code=404, detail="Task not found for deletion")
-
-    return {"id": task_id, "category_id": category_id, "message": delete_result["message"]}
\ No newline at end of file
+        logger.error("Task with ID %s not found", task_id)
+        raise HTTPException(status_code=404, detail="Task not found")
+    return delete_result
\ No newline at end of file
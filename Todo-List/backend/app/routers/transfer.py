@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from app.schemas import ImportResult
+from app.crud import export_board, import_board
+from app.core.database import SessionLocal
+from app.core.replica import replica_router
+from app.core.dependencies import get_db
+import codecs
+import io
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _stream_export(format: str, engine):
+    # The stream outlives the request handler, so it owns its session instead of using get_read_db
+    db = SessionLocal(bind=engine)
+    try:
+        yield from export_board(db, format=format)
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_endpoint(request: Request, format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    logger.info("Request to export board as %s", format)
+    return StreamingResponse(
+        _stream_export(format, replica_router.engine_for(request)),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="board.{format}"'},
+    )
+
+
+# Uploads larger than this are spooled to a temporary file instead of memory
+IMPORT_SPOOL_BYTES = 1024 * 1024
+
+
+@router.post("/import", response_model=ImportResult)
+async def import_endpoint(request: Request, format: str = Query("ndjson", pattern="^(ndjson|csv)$"), db: Session = Depends(get_db)):
+    logger.info("Request to import board from %s", format)
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as upload:
+        # Rows are committed in chunks, so bad bytes must be caught before the first one is written
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            async for chunk in request.stream():
+                decoder.decode(chunk)
+                upload.write(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Upload must be UTF-8 text")
+        upload.seek(0)
+        stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        try:
+            return await run_in_threadpool(import_board, db, stream, format)
+        except SQLAlchemyError as e:
+            logger.error("Error importing board: %s", e)
+            raise HTTPException(status_code=500, detail="Database error")
+        finally:
+            stream.detach()
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 class TaskBase(BaseModel):
     title: str
@@ -11,6 +11,13 @@ class TaskCreate(TaskBase):
 
 class TaskUpdate(TaskBase):
     category_id: int
+
+class TaskPatch(BaseModel):
+    """Sparse task update; fields left out or sent as null keep their current value."""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    task_order: Optional[int] = None
+    category_id: Optional[int] = None
     
 class Task(TaskBase):
     id: int
@@ -31,9 +38,119 @@ class CategoryCreate(CategoryBase):
 class CategoryUpdate(CategoryBase):
     pass
 
+class CategoryPatch(BaseModel):
+    """Sparse category update; fields left out or sent as null keep their current value."""
+    name: Optional[str] = None
+    category_order: Optional[int] = None
+
 class Category(CategoryBase):
     id: int
     tasks: List[Task] = []
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TaskPage(BaseModel):
+    items: List[Task] = []
+    next_cursor: Optional[str] = None
+
+
+class TaskSearchHit(Task):
+    rank: float
+
+
+class TaskSearchPage(BaseModel):
+    items: List[TaskSearchHit] = []
+    next_offset: Optional[int] = None
+
+
+class CategoryPage(BaseModel):
+    items: List[Category] = []
+    next_cursor: Optional[str] = None
+
+
+class CategorySummary(CategoryBase):
+    id: int
+    task_count: int
+
+
+class Board(BaseModel):
+    categories: List[Category] = []
+
+
+class TaskMove(BaseModel):
+    task_id: int
+    category_id: int
+    after_id: Optional[int] = None
+
+
+class CategoryMove(BaseModel):
+    category_id: int
+    after_id: Optional[int] = None
+
+
+class ReorderRequest(BaseModel):
+    categories: List[CategoryMove] = []
+    tasks: List[TaskMove] = []
+
+
+class CategoryOrder(BaseModel):
+    id: int
+    category_order: int
+
+    class Config:
+        from_attributes = True
+
+
+class ReorderResult(BaseModel):
+    categories: List[CategoryOrder] = []
+    tasks: List[Task] = []
+
+
+# Upper bound on items per bulk request, keeping one transaction's lock time bounded
+BULK_MAX_ITEMS = 1000
+
+
+class TaskBulkCreateItem(TaskCreate):
+    category_id: int
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkCreate(BaseModel):
+    items: List[TaskBulkCreateItem] = Field(..., max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: List[int] = Field(..., max_length=BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: str
+    detail: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    results: List[BulkItemResult] = []
+
+
+class ImportLineError(BaseModel):
+    line: int
+    detail: str
+
+
+class ImportResult(BaseModel):
+    lines: int
+    categories_created: int
+    tasks_created: int
+    error_count: int
+    errors: List[ImportLineError] = []
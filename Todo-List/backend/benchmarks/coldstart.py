@@ -0,0 +1,107 @@
+"""Cold-start benchmark: how long a fresh worker takes to import, start and serve.
+
+Each run is a new interpreter that imports main, enters the app lifespan and serves
+one GET /v1/board, reporting each phase separately. It also checks that importing
+the app did no I/O: no engine built and no log writer started before startup.
+
+    cd backend
+    python -m benchmarks.coldstart --runs 20 --save benchmarks/coldstart.json
+    python -m benchmarks.coldstart --compare benchmarks/coldstart.json
+
+Without DATABASE_URI a throwaway SQLite file is used; an existing DATABASE_URI
+is only wiped and reseeded with --reset.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.seed import add_database_arguments, prepare_database
+
+from benchmarks.run import compare, percentile
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+from app.core import database, logging_config
+import_io = database._engine is not None or logging_config._listener is not None
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    t2 = time.perf_counter()
+    status = client.get("/v1/board").status_code
+    t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "startup": t2 - t1, "first_request": t3 - t2,
+                  "import_io": import_io, "status": status}))
+"""
+
+PHASES = ("import", "startup", "first_request", "process_total")
+
+
+def probe(env):
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True)
+    total = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip())
+    sample = json.loads(completed.stdout.strip().splitlines()[-1])
+    sample["process_total"] = total
+    return sample
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to start")
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--tasks-per-category", type=int, default=10)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare p95 against this saved JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed p95 slowdown before flagging (0.15 = 15%%)")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    engine, _ = prepare_database(args.categories, args.tasks_per_category, reset=args.reset)
+    engine.dispose()
+
+    samples = [probe(dict(os.environ)) for _ in range(args.runs)]
+    results = {
+        "config": {"runs": args.runs, "database": engine.dialect.name, "python": sys.version.split()[0]},
+        "scenarios": {},
+    }
+
+    print(f"{'phase':<28}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for phase in PHASES:
+        timings = [sample[phase] for sample in samples]
+        stats = {
+            "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+            "max_ms": round(max(timings) * 1000, 3),
+        }
+        results["scenarios"][phase] = stats
+        print(f"{phase:<28}{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['max_ms']:>9}")
+
+    errors = sum(sample["status"] >= 400 for sample in samples)
+    import_io = sum(sample["import_io"] for sample in samples)
+    results["config"].update(errors=errors, import_io=import_io)
+    if errors:
+        print(f"\n{errors} of {args.runs} first requests failed")
+    if import_io:
+        print(f"\n{import_io} of {args.runs} imports built the engine or started logging")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.tolerance):
+                return 1
+    return 1 if errors or import_io else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Check the query plan of every read issued by the crud layer.
+
+Builds the schema with ``alembic upgrade head``, so the plans are those of a
+migrated database rather than of create_all, seeds a board, runs each crud read
+while recording the SQL it emits, then EXPLAINs every recorded SELECT, once
+before and once after ANALYZE. A plan fails when it scans the tasks table
+without an index or sorts in a temporary structure instead of reading an index
+in order. Search results are ranked by relevance, which no index can provide,
+so search plans may sort but must use the full-text index. Exits non-zero on
+any failure, so it can gate a change that drops or reshapes an index;
+tests/test_query_plans.py runs the same check.
+
+    cd backend
+    python -m benchmarks.explain            # print failures only
+    python -m benchmarks.explain --verbose  # print every plan
+
+Without DATABASE_URI a throwaway SQLite file is used; an existing DATABASE_URI
+is only wiped and reseeded with --reset. PostgreSQL plans are checked for Seq
+Scan on tasks and explicit Sort nodes.
+"""
+import argparse
+import os
+import sys
+
+from benchmarks.seed import add_database_arguments, prepare_database
+
+
+# Reads ordered by relevance: sorting is expected, skipping the full-text index is not
+RANKED_READS = {"search_tasks", "search_tasks(category)"}
+
+
+def plan_problems(dialect, plan_lines, ranked=False):
+    """Human-readable reasons a plan is not index driven; empty when it is fine."""
+    problems = []
+    for line in plan_lines:
+        if dialect == "sqlite":
+            if line.split()[:2] == ["SCAN", "tasks"] and "USING" not in line:
+                problems.append("full scan of tasks")
+            if "TEMP B-TREE" in line and not ranked:
+                problems.append("sort in a temporary b-tree")
+        elif dialect == "postgresql":
+            if "Seq Scan on tasks" in line:
+                problems.append("sequential scan of tasks")
+            if line.lstrip("-> ").startswith("Sort") and not ranked:
+                problems.append("explicit sort")
+    if ranked and dialect == "sqlite" and not any(line.startswith("SCAN tasks_fts VIRTUAL TABLE") for line in plan_lines):
+        problems.append("full-text index not used")
+    return problems
+
+
+def explain(connection, statement, parameters):
+    from sqlalchemy import text
+
+    dialect = connection.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    rows = connection.exec_driver_sql(prefix + statement, parameters).fetchall()
+    # SQLite returns (id, parent, notused, detail); PostgreSQL one text column per line
+    return [row[-1] for row in rows]
+
+
+def crud_reads(db, category_id, task_id):
+    """Every read path in app.crud, each with arguments that reach its index."""
+    from app import crud
+    from app.core.cache import row_cache
+    from app.core.pagination import encode_cursor
+
+    row_cache.clear()
+    return {
+        "get_categories": lambda: crud.get_categories(db, limit=10),
+        "get_categories(as_dicts)": lambda: crud.get_categories(db, limit=10, as_dicts=True),
+        "get_board": lambda: crud.get_board(db),
+        "get_board(as_dicts)": lambda: crud.get_board(db, as_dicts=True),
+        "get_categories_page": lambda: crud.get_categories_page(db, cursor=encode_cursor(1, 1), limit=10),
+        "get_categories_page(as_dicts)": lambda: crud.get_categories_page(db, cursor=encode_cursor(1, 1), limit=10, as_dicts=True),
+        "get_category_summary": lambda: crud.get_category_summary(db),
+        "get_category": lambda: crud.get_category(db, category_id),
+        "get_task_by_task_id": lambda: crud.get_task_by_task_id(db, task_id),
+        "get_tasks_page": lambda: crud.get_tasks_page(db, category_id, cursor=encode_cursor(1, 1), limit=10),
+        "get_tasks_page(as_dicts)": lambda: crud.get_tasks_page(db, category_id, cursor=encode_cursor(1, 1), limit=10, as_dicts=True),
+        "export_board": lambda: list(crud.export_board(db, "ndjson")),
+        "search_tasks": lambda: crud.search_tasks(db, "seeded task 7"),
+        "search_tasks(category)": lambda: crud.search_tasks(db, "seeded", category_id=category_id),
+    }
+
+
+def check_plans(engine, category_id, task_id):
+    """Run every crud read and EXPLAIN what it sent; returns (name, statement, plan, problems) per SELECT."""
+    from sqlalchemy import event
+    from app.core.database import SessionLocal
+
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            recorded.append((statement, parameters))
+
+    results = []
+    with SessionLocal(bind=engine) as db:
+        for name, read in crud_reads(db, category_id, task_id).items():
+            recorded.clear()
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                read()
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            with engine.connect() as connection:
+                for statement, parameters in recorded:
+                    plan = explain(connection, statement, parameters)
+                    results.append((name, statement, plan, plan_problems(engine.dialect.name, plan, name in RANKED_READS)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--tasks-per-category", type=int, default=50)
+    parser.add_argument("--verbose", action="store_true", help="print every plan, not just failures")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from app.models import Task
+    engine, category_ids = prepare_database(args.categories, args.tasks_per_category, reset=args.reset, migrations=True)
+    with engine.begin() as connection:
+        task_id = connection.execute(Task.__table__.select().with_only_columns(Task.id).limit(1)).scalar()
+
+    failures = 0
+    # Before and after ANALYZE: SQLite only has statistics once someone runs it
+    for analyzed in (False, True):
+        if analyzed:
+            with engine.begin() as connection:
+                connection.exec_driver_sql("ANALYZE")
+        label = " (analyzed)" if analyzed else ""
+        for name, statement, plan, problems in check_plans(engine, category_ids[len(category_ids) // 2], task_id):
+            failures += bool(problems)
+            if problems or args.verbose:
+                status = "FAIL " + ", ".join(problems) if problems else "ok"
+                print(f"{name}{label}: {status}\n  {' '.join(statement.split())}")
+                for line in plan:
+                    print(f"    {line}")
+    print(f"{failures} plan(s) with full scans or sorts")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
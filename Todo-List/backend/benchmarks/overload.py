@@ -0,0 +1,166 @@
+"""Overload test: latency with and without admission control.
+
+Seeds a board, then for each mode starts a real uvicorn server and sends it an
+open-loop stream of requests, arriving at a fixed rate above what it can serve.
+It reports latency of the requests that succeeded, how many were shed with
+503/429, and how many failed or timed out some other way.
+
+    cd backend
+    python -m benchmarks.overload --rate 400 --duration 10
+    python -m benchmarks.overload --pool-size 4 --save benchmarks/overload.json
+
+With admission off the backlog grows for as long as the overload lasts, so
+latency climbs until requests time out. With it on, the excess is turned away
+within the wait deadline. Admitted requests keep a bounded latency while
+goodput stays near capacity.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.run import percentile
+from benchmarks.seed import add_database_arguments, prepare_database
+
+PATHS = ("/v1/board", "/v1/categories/?limit=50", "/v1/categories/page?limit=50")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env, port):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--backlog", "4096"],
+        env=env,
+    )
+    import httpx
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+
+async def fetch_status(port, path, timeout) -> int:
+    """One GET over a fresh connection; a bare socket keeps the load generator's own CPU use low."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+        return int(response.split(b" ", 2)[1])
+    finally:
+        writer.close()
+
+
+async def drive(port, rate, duration, timeout):
+    """Open-loop load: start ``rate`` requests per second for ``duration`` seconds, whatever the server does."""
+    latencies, shed, failed = [], 0, 0
+
+    async def one(i):
+        nonlocal shed, failed
+        t0 = time.perf_counter()
+        try:
+            status = await fetch_status(port, PATHS[i % len(PATHS)], timeout)
+        except (OSError, ValueError, IndexError, asyncio.TimeoutError):
+            failed += 1
+            return
+        if status in (429, 503):
+            shed += 1
+        elif status >= 400:
+            failed += 1
+        else:
+            latencies.append(time.perf_counter() - t0)
+
+    started = time.perf_counter()
+    tasks = []
+    for i in range(int(rate * duration)):
+        delay = started + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    return {
+        "sent": len(tasks),
+        "ok": len(latencies),
+        "shed": shed,
+        "failed": failed,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        "max_ms": round(max(latencies) * 1000, 3) if latencies else None,
+        "goodput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100)
+    parser.add_argument("--tasks-per-category", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=400, help="requests started per second; set above what the server sustains")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of load per mode")
+    parser.add_argument("--timeout", type=float, default=30.0, help="client timeout per request, seconds")
+    parser.add_argument("--pool-size", type=int, help="cap the server's database pool at this many connections "
+                        "(no overflow, 1 s checkout timeout) and size the read group to match")
+    parser.add_argument("--save", help="write results to this JSON file")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "todo-bench.log"))
+
+    engine, _ = prepare_database(args.categories, args.tasks_per_category, reset=args.reset)
+    engine.dispose()
+
+    results = {
+        "config": {
+            "categories": args.categories,
+            "tasks_per_category": args.tasks_per_category,
+            "rate": args.rate,
+            "duration": args.duration,
+            "database": engine.dialect.name,
+        },
+        "modes": {},
+    }
+    print(f"{'mode':<16}{'sent':>7}{'ok':>7}{'shed':>7}{'failed':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'ok/s':>8}")
+    server_env = dict(os.environ)
+    if args.pool_size:
+        # A small pool makes the spike hold and time out on connections, as a busy database would
+        server_env.update(DB_POOL_SIZE=str(args.pool_size), DB_MAX_OVERFLOW="0", DB_POOL_TIMEOUT="1")
+        server_env.setdefault("ADMISSION_READ_LIMIT", str(args.pool_size))
+        results["config"]["pool_size"] = args.pool_size
+    for mode, enabled in (("no_admission", "false"), ("admission", "true")):
+        port = free_port()
+        server = start_server({**server_env, "ADMISSION_ENABLED": enabled}, port)
+        try:
+            stats = asyncio.run(drive(port, args.rate, args.duration, args.timeout))
+        finally:
+            server.terminate()
+            server.wait()
+        results["modes"][mode] = stats
+        print(f"{mode:<16}{stats['sent']:>7}{stats['ok']:>7}{stats['shed']:>7}{stats['failed']:>8}{str(stats['p50_ms']):>10}"
+              f"{str(stats['p95_ms']):>10}{str(stats['p99_ms']):>10}{str(stats['max_ms']):>10}{stats['goodput_rps']:>8}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
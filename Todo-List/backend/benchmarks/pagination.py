@@ -0,0 +1,100 @@
+"""Deep pages: OFFSET against keyset cursors on a large categories table.
+
+Seeds --categories rows (100k by default), then times the first page and the
+last page of /v1/categories/ twice: by ?skip= (OFFSET, which reads and throws
+away every row before the page) and by /v1/categories/page with a cursor built
+from the row just before the page (keyset, which seeks straight to it). Both
+deep pages must hold the same categories. Keyset latency should stay flat from
+the first page to the last while OFFSET grows with the depth.
+
+    cd backend
+    python -m benchmarks.pagination --categories 100000
+    python -m benchmarks.pagination --save benchmarks/pagination.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.run import compare
+from benchmarks.serialization import timed
+from benchmarks.seed import add_database_arguments, prepare_database
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100_000)
+    parser.add_argument("--tasks-per-category", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50, help="rows per page")
+    parser.add_argument("--requests", type=int, default=50, help="timed requests per page")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare p95 latency against this saved JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed p95 slowdown before flagging (0.15 = 15%%)")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import select
+    from app.core.pagination import encode_cursor
+    from app.models import Category
+    from main import app
+
+    engine, category_ids = prepare_database(args.categories, args.tasks_per_category, reset=args.reset)
+    client = TestClient(app)
+
+    depth = max(0, len(category_ids) - args.limit)
+    with engine.connect() as connection:
+        # The row just before the deep page, in the keyset order (category_order, id)
+        before = connection.execute(
+            select(Category.category_order, Category.id)
+            .order_by(Category.category_order.asc(), Category.id.asc())
+            .offset(depth - 1)
+            .limit(1)
+        ).first() if depth else None
+    cursor = f"&cursor={encode_cursor(*before)}" if before else ""
+
+    pages = {
+        "offset_first": f"/v1/categories/?skip=0&limit={args.limit}",
+        "offset_deep": f"/v1/categories/?skip={depth}&limit={args.limit}",
+        "keyset_first": f"/v1/categories/page?limit={args.limit}",
+        "keyset_deep": f"/v1/categories/page?limit={args.limit}{cursor}",
+    }
+    offset_ids = [category["id"] for category in client.get(pages["offset_deep"]).json()]
+    keyset_ids = [category["id"] for category in client.get(pages["keyset_deep"]).json()["items"]]
+    if offset_ids != keyset_ids:
+        print("offset and keyset deep pages differ", file=sys.stderr)
+        return 1
+
+    results = {
+        "config": {
+            "categories": len(category_ids),
+            "limit": args.limit,
+            "depth": depth,
+            "requests": args.requests,
+            "database": engine.dialect.name,
+        },
+        "scenarios": {},
+    }
+
+    print(f"{len(category_ids)} categories, pages of {args.limit}, deep page at row {depth}\n")
+    print(f"{'scenario':<16}{'p50 ms':>9}{'p95 ms':>9}{'vs first':>10}")
+    for name, path in pages.items():
+        stats = results["scenarios"][name] = timed(lambda: client.get(path), args.requests)
+        first = results["scenarios"][name.split("_")[0] + "_first"]["p50_ms"]
+        ratio = stats["p50_ms"] / first if first else 0.0
+        print(f"{name:<16}{stats['p50_ms']:>9}{stats['p95_ms']:>9}{ratio:>9.2f}x")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.tolerance):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
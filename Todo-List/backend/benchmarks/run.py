@@ -0,0 +1,310 @@
+"""Latency, throughput and query-count benchmark for the /v1 API.
+
+Seeds a fresh database, drives every /v1 endpoint but the /v1/events stream
+either in-process (TestClient) or over HTTP against a running server, and prints
+p50/p95/p99 latency, throughput and SQL statements per request for each scenario.
+
+    cd backend
+    python -m benchmarks.run --categories 100 --tasks-per-category 50 --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+Without DATABASE_URI a throwaway SQLite file is used. An existing DATABASE_URI
+is only wiped and reseeded with --reset. --url runs against a live server
+instead; that server must use the same database (so pass --reset) for the
+seeded ids to exist, and query counts are then not available.
+
+Logging is at WARNING by default, so scenarios time the handlers alone. To
+measure what logging adds to each request, run once more with --log-level INFO
+and compare p95 against the first run; the records go to a temporary log file
+unless LOG_FILE is set, and records the queue dropped are reported:
+
+    python -m benchmarks.run --save benchmarks/quiet.json
+    python -m benchmarks.run --log-level INFO --compare benchmarks/quiet.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.seed import add_database_arguments, prepare_database
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def _reserve(ids, count):
+    """Split off up to ``count`` ids, at most a quarter of them, for a scenario that deletes its rows."""
+    count = max(1, min(count, len(ids) // 4))
+    return ids[:-count], ids[-count:]
+
+
+def _import_file(index, tasks):
+    """One category and its tasks in the /v1/export NDJSON format."""
+    lines = [{"type": "category", "id": 1, "name": f"import {index}", "category_order": index}]
+    lines += [{"type": "task", "id": i, "title": f"import {i}", "description": "benchmark task", "task_order": i,
+               "category_id": 1} for i in range(tasks)]
+    return "".join(json.dumps(line) + "\n" for line in lines)
+
+
+def build_scenarios(category_ids, tasks, requests):
+    """Each scenario yields (method, path, body) tuples, one per timed request.
+
+    ``tasks`` maps each seeded task id to its category id. Bodies are sent as JSON,
+    or as raw text when they are strings. The delete scenarios remove rows set aside
+    for them, so every scenario still finds its rows whatever order they run in.
+    """
+    rng = random.Random(42)
+    category_count = len(category_ids)
+    batches = max(1, requests // 100)
+    category_ids, doomed_category_ids = _reserve(category_ids, requests)
+    kept = set(category_ids)
+    task_ids = [task_id for task_id, category_id in tasks.items() if category_id in kept]
+    task_ids, doomed_task_ids = _reserve(task_ids, requests)
+    task_ids, bulk_doomed_task_ids = _reserve(task_ids, batches * 100)
+
+    def reads(path_for):
+        return lambda: (("GET", path_for(i), None) for i in range(requests))
+
+    def categories_page_walk():
+        # Follows next_cursor; the runner swaps the placeholder for the previous response's cursor
+        return (("GET", "/v1/categories/page?limit=10&cursor={next_cursor}", None) for _ in range(requests))
+
+    def creates():
+        return (("POST", f"/v1/categories/{rng.choice(category_ids)}/tasks/",
+                 {"title": f"bench {i}", "description": "benchmark task", "task_order": i}) for i in range(requests))
+
+    def updates():
+        return (("PUT", f"/v1/tasks/{rng.choice(task_ids)}",
+                 {"title": f"bench {i}", "description": "updated", "task_order": i, "category_id": rng.choice(category_ids)})
+                for i in range(requests))
+
+    def patches():
+        return (("PATCH", f"/v1/tasks/{rng.choice(task_ids)}", {"title": f"patched {i}"}) for i in range(requests))
+
+    def deletes():
+        return (("DELETE", f"/v1/tasks/{task_id}", None) for task_id in doomed_task_ids)
+
+    def category_creates():
+        return (("POST", "/v1/categories/", {"name": f"bench {i}", "category_order": (category_count + i + 1) * 1024})
+                for i in range(requests))
+
+    def category_updates():
+        # Writes back the seeded category_order, so list reads keep their order
+        picks = (rng.randrange(len(category_ids)) for _ in range(requests))
+        return (("PUT", f"/v1/categories/{category_ids[j]}", {"name": f"bench {j}", "category_order": (j + 1) * 1024})
+                for j in picks)
+
+    def category_patches():
+        return (("PATCH", f"/v1/categories/{rng.choice(category_ids)}", {"name": f"patched {i}"}) for i in range(requests))
+
+    def category_deletes():
+        # Each category goes with all of its tasks (ON DELETE CASCADE)
+        return (("DELETE", f"/v1/categories/{category_id}", None) for category_id in doomed_category_ids)
+
+    def reorders():
+        return (("POST", "/v1/reorder",
+                 {"tasks": [{"task_id": rng.choice(task_ids), "category_id": rng.choice(category_ids)}]})
+                for _ in range(requests))
+
+    def bulk_creates():
+        return (("POST", "/v1/tasks/bulk",
+                 {"items": [{"title": f"bulk {i}", "description": "benchmark task", "task_order": i,
+                             "category_id": rng.choice(category_ids)} for i in range(100)]})
+                for _ in range(batches))
+
+    def bulk_updates():
+        return (("PUT", "/v1/tasks/bulk",
+                 {"items": [{"id": task_id, "title": f"bulk {i}", "description": "updated", "task_order": i,
+                             "category_id": rng.choice(category_ids)}
+                            for i, task_id in enumerate(rng.sample(task_ids, min(100, len(task_ids))))]})
+                for _ in range(batches))
+
+    def bulk_deletes():
+        return (("POST", "/v1/tasks/bulk/delete", {"ids": bulk_doomed_task_ids[start:start + 100]})
+                for start in range(0, len(bulk_doomed_task_ids), 100))
+
+    def single_creates_100():
+        return (("POST", f"/v1/categories/{rng.choice(category_ids)}/tasks/",
+                 {"title": f"single {i}", "description": "benchmark task", "task_order": i})
+                for i in range(batches * 100))
+
+    def imports():
+        return (("POST", "/v1/import?format=ndjson", _import_file(i, 100)) for i in range(batches))
+
+    return {
+        "categories_list": reads(lambda i: "/v1/categories/?limit=10"),
+        "categories_offset_deep": reads(lambda i: f"/v1/categories/?skip={max(0, category_count - 10)}&limit=10"),
+        "categories_page_walk": categories_page_walk,
+        "categories_summary": reads(lambda i: "/v1/categories/summary"),
+        "category_read": reads(lambda i: f"/v1/categories/{rng.choice(category_ids)}"),
+        "board": reads(lambda i: "/v1/board"),
+        "task_read": reads(lambda i: f"/v1/tasks/{rng.choice(task_ids)}"),
+        "tasks_page": reads(lambda i: f"/v1/categories/{rng.choice(category_ids)}/tasks/?limit=50"),
+        "tasks_search": reads(lambda i: f"/v1/tasks/search?q=seeded+{rng.randrange(50)}"),
+        "export_ndjson": reads(lambda i: "/v1/export?format=ndjson"),
+        "export_csv": reads(lambda i: "/v1/export?format=csv"),
+        "task_create": creates,
+        "task_update": updates,
+        "task_patch": patches,
+        "task_delete": deletes,
+        "category_create": category_creates,
+        "category_update": category_updates,
+        "category_patch": category_patches,
+        "category_delete": category_deletes,
+        "reorder": reorders,
+        "tasks_bulk_create_100": bulk_creates,
+        "tasks_bulk_update_100": bulk_updates,
+        "tasks_bulk_delete_100": bulk_deletes,
+        "tasks_single_create_100": single_creates_100,
+        "import_ndjson_100": imports,
+    }
+
+
+def run_scenario(client, requests_iter, counter):
+    latencies, queries, errors = [], [], 0
+    next_cursor = ""
+    started = time.perf_counter()
+    for method, template, body in requests_iter:
+        path = template
+        if "{next_cursor}" in template:
+            path = template.replace("{next_cursor}", next_cursor) if next_cursor else template.split("&cursor=")[0]
+        before = counter.count if counter else 0
+        t0 = time.perf_counter()
+        if isinstance(body, str):
+            response = client.request(method, path, content=body)
+        else:
+            response = client.request(method, path, json=body)
+        latencies.append(time.perf_counter() - t0)
+        if counter:
+            queries.append(counter.count - before)
+        if response.status_code >= 400:
+            errors += 1
+        elif "{next_cursor}" in template:
+            next_cursor = response.json().get("next_cursor") or ""
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "queries_per_request": round(statistics.mean(queries), 2) if queries else None,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print p95 deltas against a saved baseline; returns True when any scenario regressed."""
+    regressed = False
+    print(f"\n{'scenario':<28}{'base p95':>10}{'now p95':>10}{'delta':>9}")
+    for name, now in results["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if not base:
+            continue
+        delta = (now["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+        flag = ""
+        if delta > tolerance:
+            regressed, flag = True, "  REGRESSED"
+        print(f"{name:<28}{base['p95_ms']:>10.3f}{now['p95_ms']:>10.3f}{delta:>+9.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100)
+    parser.add_argument("--tasks-per-category", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--scenario", action="append", help="run only these scenarios (repeatable)")
+    parser.add_argument("--url", help="benchmark a running server over HTTP instead of in-process")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare p95 latency against this saved JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed p95 slowdown before flagging (0.15 = 15%%)")
+    parser.add_argument("--log-level", default="WARNING",
+                        help="application log level for in-process runs; INFO measures the cost of request logging")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # Keep benchmark output off the shared app.log
+    os.environ["LOG_LEVEL"] = args.log_level.upper()
+    os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "todo-benchmark.log"))
+
+    engine, category_ids = prepare_database(args.categories, args.tasks_per_category, reset=args.reset)
+    with engine.connect() as connection:
+        from app.models import Task
+
+        tasks = dict(connection.execute(Task.__table__.select().with_only_columns(Task.id, Task.category_id)).all())
+
+    if args.url:
+        import httpx
+
+        client, counter = httpx.Client(base_url=args.url), None
+    else:
+        from fastapi.testclient import TestClient
+        from app.core.logging_config import setup_logging
+        from main import app
+
+        # The client is not entered, so lifespan does not run; install the queued log handler it would
+        setup_logging()
+        client, counter = TestClient(app), QueryCounter(engine)
+
+    scenarios = build_scenarios(category_ids, tasks, args.requests)
+    selected = args.scenario or list(scenarios)
+    results = {
+        "config": {
+            "categories": args.categories,
+            "tasks_per_category": args.tasks_per_category,
+            "requests": args.requests,
+            "mode": "http" if args.url else "in-process",
+            "log_level": None if args.url else os.environ["LOG_LEVEL"],
+            "database": engine.dialect.name,
+        },
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<28}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}{'errors':>8}")
+    for name in selected:
+        stats = run_scenario(client, scenarios[name](), counter)
+        results["scenarios"][name] = stats
+        queries = "-" if stats["queries_per_request"] is None else stats["queries_per_request"]
+        print(f"{name:<28}{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+              f"{stats['throughput_rps']:>9}{queries:>9}{stats['errors']:>8}")
+
+    if not args.url:
+        from app.core.logging_config import logging_stats, shutdown_logging
+
+        # Stop the writer thread so every queued record has reached the log file
+        shutdown_logging()
+        results["logging"] = logging_stats()
+        print(f"\nlog level {results['logging']['level']}, {results['logging']['dropped']} records dropped"
+              f" ({os.environ['LOG_FILE']})")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.tolerance):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from sqlalchemy import inspect, insert
+from app.models import Category, Task
+
+# alembic.ini lives next to backend/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def add_database_arguments(parser):
+    """The --reset flag every benchmark takes; see prepare_database."""
+    parser.add_argument("--reset", action="store_true",
+                        help="drop and reseed the tables of an existing DATABASE_URI (without it, only a throwaway "
+                             "or empty database is seeded)")
+
+
+def seed(engine, categories: int, tasks_per_category: int, gap: int = 1024):
+    """Fill an empty database with ``categories`` columns of ``tasks_per_category`` tasks each."""
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Category),
+            [{"name": f"Category {i}", "category_order": (i + 1) * gap} for i in range(categories)],
+        )
+        category_ids = [row.id for row in connection.execute(Category.__table__.select().order_by(Category.id))]
+        batch = []
+        for category_id in category_ids:
+            for j in range(tasks_per_category):
+                batch.append({
+                    "title": f"Task {j} of {category_id}",
+                    "description": f"Seeded task number {j} in category {category_id}",
+                    "task_order": (j + 1) * gap,
+                    "category_id": category_id,
+                })
+                if len(batch) >= 10000:
+                    connection.execute(insert(Task), batch)
+                    batch = []
+        if batch:
+            connection.execute(insert(Task), batch)
+    return category_ids
+
+
+def run_alembic(engine, *command):
+    """Run an alembic command against ``engine``'s database in a child process.
+
+    alembic's env.py imports the models under another module path and sets up
+    logging from alembic.ini, neither of which should happen in this process.
+    """
+    url = engine.url.render_as_string(hide_password=False)
+    subprocess.run([sys.executable, "-m", "alembic", *command], cwd=REPO_ROOT,
+                   env={**os.environ, "DATABASE_URI": url}, check=True, capture_output=True)
+
+
+def drop_schema(engine, migrations: bool = False):
+    """Drop every table, including the full-text index that drop_all does not know about."""
+    from app.core.database import Base
+
+    if migrations:
+        run_alembic(engine, "downgrade", "base")
+    Base.metadata.drop_all(bind=engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE IF EXISTS tasks_fts")
+
+
+def prepare_database(categories: int, tasks_per_category: int, reset: bool = False, migrations: bool = False):
+    """Seed a database for a benchmark and return ``(engine, category_ids)``.
+
+    Without DATABASE_URI a throwaway SQLite file is created and used. A database
+    named by DATABASE_URI is only seeded when it has no tables yet, or dropped
+    and reseeded when ``reset`` is true; otherwise the benchmark stops instead of
+    wiping it. With ``migrations`` the schema is built by ``alembic upgrade head``
+    rather than from the models.
+    """
+    if not os.getenv("DATABASE_URI"):
+        os.environ["DATABASE_URI"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="todo-bench-"), "bench.db")
+        reset = True
+
+    from app.core.database import Base, get_engine
+
+    engine = get_engine()
+    if inspect(engine).get_table_names():
+        if not reset:
+            raise SystemExit(f"{engine.url!r} already has tables; pass --reset to drop and reseed them, "
+                             "or unset DATABASE_URI to use a throwaway database")
+        drop_schema(engine, migrations=migrations)
+    if migrations:
+        run_alembic(engine, "upgrade", "head")
+    else:
+        Base.metadata.create_all(bind=engine)
+    return engine, seed(engine, categories, tasks_per_category)
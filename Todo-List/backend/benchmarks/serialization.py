@@ -0,0 +1,121 @@
+"""Fast serialization vs the response_model path for list and board endpoints.
+
+Seeds a board, then times each endpoint twice in-process: with FAST_SERIALIZATION
+(row tuples encoded by FastJSONResponse) and with the Pydantic response_model
+path. It also times encoding alone, without the database, for the whole board.
+
+    cd backend
+    python -m benchmarks.serialization --categories 200 --tasks-per-category 50
+    python -m benchmarks.serialization --save benchmarks/serialization.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from benchmarks.run import compare, percentile
+from benchmarks.seed import add_database_arguments, prepare_database
+
+ENDPOINTS = {
+    "board": "/v1/board",
+    "categories_list": "/v1/categories/?limit=100",
+    "categories_page": "/v1/categories/page?limit=100",
+    "tasks_page": "/v1/categories/{category_id}/tasks/?limit=500",
+}
+
+
+def set_fast(enabled: bool):
+    from app.core import serialization
+    from app.routers import board, categories, tasks
+
+    for module in (serialization, board, categories, tasks):
+        module.FAST_SERIALIZATION = enabled
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return {
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100)
+    parser.add_argument("--tasks-per-category", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=50, help="timed requests per endpoint and mode")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare p95 latency against this saved JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed p95 slowdown before flagging (0.15 = 15%%)")
+    add_database_arguments(parser)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from fastapi.testclient import TestClient
+    from app.core.database import SessionLocal
+    from app.core.serialization import FastJSONResponse, orjson
+    from app.crud import get_board
+    from app.schemas import Board
+    from main import app
+
+    engine, category_ids = prepare_database(args.categories, args.tasks_per_category, reset=args.reset)
+    client = TestClient(app)
+
+    results = {
+        "config": {
+            "categories": args.categories,
+            "tasks_per_category": args.tasks_per_category,
+            "requests": args.requests,
+            "encoder": "orjson" if orjson is not None else "json",
+            "database": engine.dialect.name,
+        },
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<34}{'p50 ms':>9}{'p95 ms':>9}{'speedup':>9}")
+    for name, template in ENDPOINTS.items():
+        path = template.format(category_id=category_ids[0])
+        stats = {}
+        for mode, enabled in (("model", False), ("fast", True)):
+            set_fast(enabled)
+            client.get(path)
+            stats[mode] = timed(lambda: client.get(path), args.requests)
+            results["scenarios"][f"{name}.{mode}"] = stats[mode]
+        for mode in ("model", "fast"):
+            speedup = stats["model"]["p50_ms"] / stats[mode]["p50_ms"] if stats[mode]["p50_ms"] else 0.0
+            print(f"{name + '.' + mode:<34}{stats[mode]['p50_ms']:>9}{stats[mode]['p95_ms']:>9}{speedup:>8.2f}x")
+
+    # Encoding only: the same board loaded once, serialized both ways
+    with SessionLocal(bind=engine) as db:
+        categories = get_board(db)
+        rows = get_board(db, as_dicts=True)
+        encode = {
+            "model": lambda: Board.model_validate({"categories": categories}).model_dump_json(),
+            "fast": lambda: FastJSONResponse({"categories": rows}).body,
+        }
+        stats = {mode: timed(fn, args.requests) for mode, fn in encode.items()}
+    for mode in ("model", "fast"):
+        results["scenarios"][f"encode_board.{mode}"] = stats[mode]
+        speedup = stats["model"]["p50_ms"] / stats[mode]["p50_ms"] if stats[mode]["p50_ms"] else 0.0
+        print(f"{'encode_board.' + mode:<34}{stats[mode]['p50_ms']:>9}{stats[mode]['p95_ms']:>9}{speedup:>8.2f}x")
+    set_fast(True)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.tolerance):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,31 @@
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import tasks , categories
-from app.core.database import Base
-from app.core.database import engine
+from app.routers import tasks , categories, board, internal, metrics, transfer, events
+from app.core.database import get_engine, dispose_engines, USE_ASYNC_DB
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.core.compression import CompressionMiddleware, compression_options
+from app.core.admission import AdmissionMiddleware, admission_options
+from app.core.replica import ReadYourWritesMiddleware
+from app.core.purge import category_purger
+from app.core.metrics import RequestStats, current_request_stats, request_duration, request_queries, request_query_time
+from contextlib import asynccontextmanager
+import time
 import uvicorn
-import logging
 
 
-# Create the database tables 
-Base.metadata.create_all(bind=engine)
+# Importing this module does no I/O: logging and the engine are set up when the server
+# starts, and the schema is managed by alembic (`alembic upgrade head`), not create_all
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # Builds the engine so a bad DATABASE_URI fails the boot; no connection is opened yet
+    get_engine()
+    if category_purger.enabled:
+        # Finish soft deletes a previous process left half purged
+        category_purger.start(categories.purge_step)
+    yield
+    await dispose_engines()
+    shutdown_logging()
 
 
 # Create the FastAPI app instance with metadata
@@ -17,6 +34,7 @@ app = FastAPI(
     description="description",
     summary="Todo App with FastAPI and React",
     version="0.0.1",
+    lifespan=lifespan,
 )
 
 
@@ -26,9 +44,74 @@ def read_root():
     return {"Hello": "World"}
 
 
+def sync_fallback(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """The routes of ``sync_router`` that ``async_router`` has no twin for.
+
+    The async stack only mirrors the basic reads and writes; search, summaries,
+    task pages, PATCH and bulk writes keep running on the sync engine. Mounted
+    before the async router, so literal paths such as /tasks/search are matched
+    ahead of its /tasks/{task_id}.
+    """
+    served = {(route.path, method) for route in async_router.routes for method in route.methods}
+    fallback = APIRouter()
+    fallback.routes.extend(
+        route for route in sync_router.routes if not any((route.path, method) in served for method in route.methods)
+    )
+    return fallback
+
+
 # Include routers from other files in the app
-app.include_router(tasks.router, prefix="/v1", tags=["tasks"])
-app.include_router(categories.router, prefix="/v1", tags=["categories"])
+if USE_ASYNC_DB:
+    from app.routers import async_tasks, async_categories
+
+    app.include_router(sync_fallback(tasks.router, async_tasks.router), prefix="/v1", tags=["tasks"])
+    app.include_router(sync_fallback(categories.router, async_categories.router), prefix="/v1", tags=["categories"])
+    app.include_router(async_tasks.router, prefix="/v1", tags=["tasks"])
+    app.include_router(async_categories.router, prefix="/v1", tags=["categories"])
+else:
+    app.include_router(tasks.router, prefix="/v1", tags=["tasks"])
+    app.include_router(categories.router, prefix="/v1", tags=["categories"])
+app.include_router(board.router, prefix="/v1", tags=["board"])
+app.include_router(transfer.router, prefix="/v1", tags=["transfer"])
+app.include_router(events.router, prefix="/v1", tags=["events"])
+app.include_router(internal.router, prefix="/internal", tags=["internal"], include_in_schema=False)
+app.include_router(metrics.router, tags=["internal"], include_in_schema=False)
+
+
+# Compress large responses; added first so it sits inside the metrics and CORS middleware
+app.add_middleware(CompressionMiddleware, **compression_options())
+# Bound in-flight requests per route group; rejections still get CORS headers and show up in metrics
+app.add_middleware(AdmissionMiddleware, **admission_options())
+# With a read replica configured, send a client's reads to the primary for a while after it writes
+app.add_middleware(ReadYourWritesMiddleware)
+
+
+def _route_template(request: Request) -> str:
+    """Full path with parameter values put back as {names}, so metric labels stay bounded."""
+    if request.scope.get("route") is None:
+        return "unmatched"
+    params = {str(value): name for name, value in request.path_params.items()}
+    return "/".join("{" + params[part] + "}" if part in params else part for part in request.url.path.split("/"))
+
+
+# Record per-route latency and the SQL work each request caused
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        current_request_stats.reset(token)
+        route_path = _route_template(request)
+        request_duration.observe((request.method, route_path, str(status)), elapsed)
+        request_queries.observe((route_path,), stats.queries)
+        request_query_time.observe((route_path,), stats.query_time)
 
 
 # Configure CORS
@@ -43,40 +126,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
     expose_headers=["Access-Control-Allow-Origin",
-                    "Access-Control-Allow-Headers"]
+                    "Access-Control-Allow-Headers",
+                    "ETag",
+                    "Last-Modified"]
 )
 
-# Configure logging
-logging.config.dictConfig({
-    'version': 1,
-    'disable_existing_loggers': False,
-    'formatters': {
-        'default': {
-            'format': '[%(asctime)s] %(levelname)s in %(module)s: %(message)s',
-        },
-    },
-    'handlers': {
-        'file': {
-            'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': 'app.log',
-            'formatter': 'default',
-        },
-    },
-    'loggers': {
-        '': {
-            'handlers': ['file'],
-            'level': 'INFO',
-            'propagate': True,
-        },
-        'watchfiles.main': {
-            'handlers': ['file'],
-            'level': 'WARNING',
-            'propagate': False,
-        },
-    },
-})
-
-
 if __name__ == "__main__":
+    # Only the dev entry point reads .env; under plain uvicorn pass --env-file .env
+    from dotenv import load_dotenv
+
+    load_dotenv()
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+# The fixtures drop and reseed tables, so never let a configured DATABASE_URI through
+os.environ["DATABASE_URI"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="todo-tests-"), "test.db")
+for name in ("ASYNC_DATABASE_URI", "REPLICA_DATABASE_URI", "USE_ASYNC_DB", "CATEGORY_SOFT_DELETE_MIN_TASKS"):
+    os.environ.pop(name, None)
+
+import pytest
+from sqlalchemy import delete
+
+from benchmarks.seed import run_alembic, seed
+
+
+@pytest.fixture(scope="session")
+def migrated_engine():
+    """The test database, built once by ``alembic upgrade head``."""
+    from app.core.database import get_engine
+
+    engine = get_engine()
+    run_alembic(engine, "upgrade", "head")
+    return engine
+
+
+def clear_tables(engine):
+    from app.core.cache import row_cache
+    from app.core.versioning import board_version
+    from app.models import Category, Task
+
+    with engine.begin() as connection:
+        connection.execute(delete(Task))
+        connection.execute(delete(Category))
+    row_cache.clear()
+    # Rows written behind crud's back: new ETags keep 304s and compressed bodies from the old board
+    board_version.bump()
+
+
+@pytest.fixture
+def engine(migrated_engine):
+    """The migrated database with no rows and an empty row cache."""
+    clear_tables(migrated_engine)
+    return migrated_engine
+
+
+@pytest.fixture
+def reseed(engine):
+    """Replace the board with a freshly seeded one; returns the new category ids."""
+
+    def reseed(categories, tasks_per_category, gap=1024):
+        clear_tables(engine)
+        return seed(engine, categories, tasks_per_category, gap=gap)
+
+    return reseed
+
+
+@pytest.fixture
+def client(engine):
+    """Calls the app in-process; the lifespan is not run, so nothing is logged to app.log."""
+    from fastapi.testclient import TestClient
+    from main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Types of the board events published during the test, in order."""
+    from app.core.events import event_bus
+
+    events = []
+    monkeypatch.setattr(event_bus, "publish", lambda type, **data: events.append(type))
+    return events
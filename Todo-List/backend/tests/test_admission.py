@@ -0,0 +1,64 @@
+import asyncio
+
+from app.core.admission import AdmissionGate, route_group
+
+
+def test_route_groups():
+    assert route_group("GET", "/v1/board") == "read"
+    assert route_group("POST", "/v1/reorder") == "write"
+    assert route_group("POST", "/v1/tasks/bulk") == "bulk"
+    assert route_group("GET", "/v1/events") is None
+    assert route_group("GET", "/internal/pool") is None
+
+
+def test_full_queue_rejects_at_once():
+    async def scenario():
+        gate = AdmissionGate("test", limit=1, queue_size=1, wait_timeout=5)
+        assert await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert not await gate.acquire()
+        gate.release()
+        assert await waiter
+        return gate
+
+    gate = asyncio.run(scenario())
+    # The released slot went straight to the waiter
+    assert gate.stats() | {"wait_timeout_ms": None} == {
+        "limit": 1, "queue_size": 1, "wait_timeout_ms": None, "in_flight": 1,
+        "waiting": 0, "admitted": 2, "rejected": 1, "timed_out": 0,
+    }
+
+
+def test_waiters_are_admitted_in_arrival_order():
+    async def scenario():
+        gate = AdmissionGate("test", limit=1, queue_size=3, wait_timeout=5)
+        await gate.acquire()
+        order = []
+
+        async def request(name):
+            await gate.acquire()
+            order.append(name)
+
+        waiters = [asyncio.create_task(request(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        for _ in waiters:
+            gate.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*waiters)
+        return order
+
+    assert asyncio.run(scenario()) == ["a", "b", "c"]
+
+
+def test_waiter_times_out_without_leaking_its_slot():
+    async def scenario():
+        gate = AdmissionGate("test", limit=1, queue_size=1, wait_timeout=0.01)
+        await gate.acquire()
+        assert not await gate.acquire()
+        gate.release()
+        assert await gate.acquire()
+        return gate
+
+    gate = asyncio.run(scenario())
+    assert (gate.in_flight, gate.timed_out, gate.stats()["waiting"]) == (1, 1, 0)
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import async_crud, crud
+from app.core.database import SessionLocal, _install_hooks
+from app.schemas import TaskUpdate
+
+
+@pytest.fixture
+def run_async(engine):
+    """Runs ``work(db)`` on an AsyncSession against the test database."""
+    url = engine.url.set(drivername="sqlite+aiosqlite")
+
+    def run(work):
+        async def main():
+            async_engine = create_async_engine(url)
+            _install_hooks(async_engine.sync_engine)
+            try:
+                async with AsyncSession(async_engine, autoflush=False, expire_on_commit=False) as db:
+                    return await work(db)
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_async_task_update_refreshes_the_sync_row_cache(engine, reseed, run_async):
+    [category_id] = reseed(1, 1)
+    with SessionLocal(bind=engine) as db:
+        task = crud.get_category(db, category_id).tasks[0]
+        assert crud.get_task_by_task_id(db, task.id).title == "Task 0 of 1"
+
+    update = TaskUpdate(title="NEW", description=task.description, task_order=task.task_order, category_id=category_id)
+    run_async(lambda db: async_crud.update_task(db, task.id, update))
+
+    with SessionLocal(bind=engine) as db:
+        assert crud.get_task_by_task_id(db, task.id).title == "NEW"
+        assert [t.title for t in crud.get_category(db, category_id).tasks] == ["NEW"]
+
+
+def test_async_delete_soft_deletes_large_categories(engine, reseed, run_async):
+    deleted, kept = reseed(2, 3)
+
+    result = run_async(lambda db: async_crud.delete_category(db, deleted, soft_delete_min_tasks=3))
+
+    assert result["purge_pending"] is True
+    with SessionLocal(bind=engine) as db:
+        assert [category["id"] for category in crud.get_board(db, as_dicts=True)] == [kept]
+        assert crud.purge_deleted_categories(db, batch_size=10) == 3
+        assert crud.purge_deleted_categories(db, batch_size=10) is None
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import event
+
+CATEGORY_COUNTS = (1, 10, 100)
+
+
+@pytest.fixture(params=[False, True], ids=["orm", "as_dicts"])
+def fast_serialization(request, monkeypatch):
+    from app.routers import board, categories
+
+    monkeypatch.setattr(board, "FAST_SERIALIZATION", request.param)
+    monkeypatch.setattr(categories, "FAST_SERIALIZATION", request.param)
+
+
+def get_counting_queries(engine, client, path):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    return response.json(), len(statements)
+
+
+@pytest.mark.usefixtures("fast_serialization")
+@pytest.mark.parametrize("path, categories_of", [
+    ("/v1/categories/?limit=1000", lambda body: body),
+    ("/v1/board", lambda body: body["categories"]),
+])
+def test_query_count_does_not_grow_with_categories(engine, client, reseed, path, categories_of):
+    counts = {}
+    for total in CATEGORY_COUNTS:
+        reseed(total, 3)
+        body, counts[total] = get_counting_queries(engine, client, path)
+        assert len(categories_of(body)) == total
+        assert all(len(category["tasks"]) == 3 for category in categories_of(body))
+
+    assert len(set(counts.values())) == 1, f"statements per request by category count: {counts}"
@@ -0,0 +1,56 @@
+from app.schemas import BULK_MAX_ITEMS
+
+
+def titles(client, category_id):
+    return [task["title"] for task in client.get(f"/v1/categories/{category_id}").json()["tasks"]]
+
+
+def test_bulk_create_reports_each_item(client, reseed, published):
+    [category_id] = reseed(1, 0)
+
+    results = client.post("/v1/tasks/bulk", json={"items": [
+        {"title": "a", "description": "d", "task_order": 1, "category_id": category_id},
+        {"title": "b", "description": "d", "task_order": 2, "category_id": 999999},
+        {"title": "c", "description": "d", "task_order": 3, "category_id": category_id},
+    ]}).json()["results"]
+
+    assert [(r["index"], r["status"]) for r in results] == [(0, "created"), (1, "error"), (2, "created")]
+    assert results[1]["detail"] == "Category 999999 not found" and results[1]["id"] is None
+    assert [client.get(f"/v1/tasks/{results[i]['id']}").json()["title"] for i in (0, 2)] == ["a", "c"]
+    assert titles(client, category_id) == ["a", "c"]
+    assert published == ["board.changed"]
+
+
+def test_bulk_update_applies_valid_items_and_reports_the_rest(client, reseed):
+    source, target = reseed(2, 2)
+    first, second = (task["id"] for task in client.get(f"/v1/categories/{source}").json()["tasks"])
+
+    results = client.put("/v1/tasks/bulk", json={"items": [
+        {"id": first, "title": "moved", "description": "d", "task_order": 9000, "category_id": target},
+        {"id": 999999, "title": "x", "description": "d", "task_order": 1, "category_id": target},
+        {"id": second, "title": "x", "description": "d", "task_order": 1, "category_id": 999999},
+    ]}).json()["results"]
+
+    assert [(r["id"], r["status"], r.get("detail")) for r in results] == [
+        (first, "updated", None), (999999, "error", "Task not found"), (second, "error", "Category 999999 not found"),
+    ]
+    assert titles(client, source) == [f"Task 1 of {source}"]
+    assert titles(client, target)[-1] == "moved"
+
+
+def test_bulk_delete_reports_missing_ids(client, reseed):
+    [category_id] = reseed(1, 3)
+    ids = [task["id"] for task in client.get(f"/v1/categories/{category_id}").json()["tasks"]]
+
+    results = client.post("/v1/tasks/bulk/delete", json={"ids": [ids[0], 999999, ids[2]]}).json()["results"]
+
+    assert [(r["index"], r["id"], r["status"]) for r in results] == [
+        (0, ids[0], "deleted"), (1, 999999, "error"), (2, ids[2], "deleted"),
+    ]
+    assert titles(client, category_id) == [f"Task 1 of {category_id}"]
+
+
+def test_bulk_requests_are_capped(client, reseed):
+    response = client.post("/v1/tasks/bulk/delete", json={"ids": list(range(BULK_MAX_ITEMS + 1))})
+
+    assert response.status_code == 422
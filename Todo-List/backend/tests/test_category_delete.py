@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.core.purge import category_purger
+from app.models import Category, Task
+from app.routers import categories
+
+
+@pytest.fixture
+def soft_delete(monkeypatch):
+    """Soft-delete categories of 3 or more tasks; purges are run by the test, not the thread."""
+    started = []
+    monkeypatch.setattr(category_purger, "min_tasks", 3)
+    monkeypatch.setattr(category_purger, "start", started.append)
+    return started
+
+
+def count(engine, model, *where):
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(model).where(*where)).scalar()
+
+
+def test_delete_cascades_to_tasks(client, engine, reseed):
+    deleted, kept = reseed(2, 4)
+
+    response = client.delete(f"/v1/categories/{deleted}")
+
+    assert response.json()["purge_pending"] is False
+    assert count(engine, Task, Task.category_id == deleted) == 0
+    assert count(engine, Task, Task.category_id == kept) == 4
+
+
+def test_soft_deleted_category_is_hidden_at_once(client, engine, reseed, soft_delete):
+    deleted, kept = reseed(2, 4)
+    task_id = client.get(f"/v1/categories/{deleted}").json()["tasks"][0]["id"]
+
+    response = client.delete(f"/v1/categories/{deleted}")
+
+    assert response.json()["purge_pending"] is True
+    assert soft_delete == [categories.purge_step]
+    assert [category["id"] for category in client.get("/v1/board").json()["categories"]] == [kept]
+    assert client.get(f"/v1/categories/{deleted}").status_code == 404
+    assert client.get(f"/v1/tasks/{task_id}").status_code == 404
+    assert client.post(f"/v1/categories/{deleted}/tasks/", json={"title": "t", "description": "d", "task_order": 1}).status_code == 404
+    assert client.delete(f"/v1/categories/{deleted}").status_code == 404
+    # Hidden, not yet removed
+    assert count(engine, Task, Task.category_id == deleted) == 4
+
+
+def test_small_categories_are_deleted_outright_in_soft_mode(client, engine, reseed, soft_delete):
+    [category_id] = reseed(1, 2)
+
+    assert client.delete(f"/v1/categories/{category_id}").json()["purge_pending"] is False
+    assert soft_delete == []
+    assert count(engine, Category) == 0
+
+
+def test_purge_removes_tasks_in_batches_then_the_category(client, engine, reseed, soft_delete, monkeypatch):
+    deleted, kept = reseed(2, 5)
+    client.delete(f"/v1/categories/{deleted}")
+    monkeypatch.setattr(category_purger, "batch_size", 2)
+
+    batches = []
+    while (purged := categories.purge_step()) is not None:
+        batches.append(purged)
+
+    assert batches == [2, 2, 1]
+    assert count(engine, Category, Category.id == deleted) == 0
+    assert count(engine, Task, Task.category_id == kept) == 5
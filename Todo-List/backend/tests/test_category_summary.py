@@ -0,0 +1,58 @@
+from sqlalchemy import func, select
+
+from app.models import Category, Task
+
+
+def summary_counts(client):
+    return {category["id"]: category["task_count"] for category in client.get("/v1/categories/summary").json()}
+
+
+def actual_counts(engine):
+    with engine.connect() as connection:
+        counted = dict(connection.execute(select(Task.category_id, func.count()).group_by(Task.category_id)).all())
+        return {category_id: counted.get(category_id, 0) for category_id in connection.execute(select(Category.id)).scalars()}
+
+
+def test_summary_lists_categories_in_board_order_with_their_counts(client, reseed):
+    first, second, third = reseed(3, 2)
+    client.patch(f"/v1/categories/{first}", json={"category_order": 99999})
+
+    summary = client.get("/v1/categories/summary").json()
+
+    assert [category["id"] for category in summary] == [second, third, first]
+    assert summary[0] == {"id": second, "name": "Category 1", "category_order": 2048, "task_count": 2}
+
+
+def test_counts_follow_single_task_writes(client, engine, reseed):
+    source, target = reseed(2, 3)
+    task_ids = [task["id"] for task in client.get(f"/v1/categories/{source}").json()["tasks"]]
+
+    client.post(f"/v1/categories/{target}/tasks/", json={"title": "t", "description": "d", "task_order": 1})
+    assert summary_counts(client) == {source: 3, target: 4}
+
+    client.delete(f"/v1/tasks/{task_ids[0]}")
+    assert summary_counts(client) == {source: 2, target: 4}
+
+    client.put(f"/v1/tasks/{task_ids[1]}", json={"title": "t", "description": "d", "task_order": 1, "category_id": target})
+    assert summary_counts(client) == {source: 1, target: 5}
+
+    client.patch(f"/v1/tasks/{task_ids[2]}", json={"category_id": target})
+    client.patch(f"/v1/tasks/{task_ids[1]}", json={"title": "same category"})
+    assert summary_counts(client) == actual_counts(engine) == {source: 0, target: 6}
+
+
+def test_counts_follow_bulk_writes_and_cascades(client, engine, reseed):
+    source, target, doomed = reseed(3, 2)
+    task_ids = [task["id"] for task in client.get(f"/v1/categories/{source}").json()["tasks"]]
+
+    client.post("/v1/tasks/bulk", json={"items": [
+        {"title": "a", "description": "d", "task_order": 1, "category_id": source},
+        {"title": "b", "description": "d", "task_order": 2, "category_id": 999999},
+    ]})
+    client.put("/v1/tasks/bulk", json={"items": [
+        {"id": task_ids[0], "title": "a", "description": "d", "task_order": 1, "category_id": target},
+    ]})
+    client.post("/v1/tasks/bulk/delete", json={"ids": [task_ids[1], 999999]})
+    client.delete(f"/v1/categories/{doomed}")
+
+    assert summary_counts(client) == actual_counts(engine) == {source: 1, target: 3}
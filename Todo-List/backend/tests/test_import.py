@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from app import crud
+from app.core.database import SessionLocal
+from app.core.versioning import board_version
+
+
+def ndjson(*rows):
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def task_rows(count, category_id=1):
+    return [{"type": "task", "title": f"t{i}", "description": "d", "task_order": i, "category_id": category_id}
+            for i in range(count)]
+
+
+def test_bad_utf8_is_rejected_before_anything_is_written(client, engine, monkeypatch):
+    monkeypatch.setattr(crud, "IMPORT_BATCH_SIZE", 10)
+    body = ndjson({"type": "category", "id": 1, "name": "c", "category_order": 1}, *task_rows(50)) + b"\xff\xfe\n"
+
+    response = client.post("/v1/import", content=body)
+
+    assert response.status_code == 400
+    assert client.get("/v1/board").json() == {"categories": []}
+
+
+def test_failure_partway_still_announces_committed_chunks(engine, monkeypatch):
+    monkeypatch.setattr(crud, "IMPORT_BATCH_SIZE", 10)
+
+    def stream():
+        yield from (line.decode() for line in ndjson({"type": "category", "id": 1, "name": "c", "category_order": 1}).splitlines(True))
+        yield from (json.dumps(row) + "\n" for row in task_rows(25))
+        raise OSError("connection reset")
+
+    version = board_version.current()[0]
+    with SessionLocal(bind=engine) as db, pytest.raises(OSError):
+        crud.import_board(db, stream())
+
+    assert board_version.current()[0] > version
+
+
+def test_csv_round_trip_keeps_empty_descriptions(client):
+    category = client.post("/v1/categories/", json={"name": "c", "category_order": 1}).json()
+    client.post(f"/v1/categories/{category['id']}/tasks/", json={"title": "blank", "description": "", "task_order": 1})
+    exported = client.get("/v1/export?format=csv").content
+    client.delete(f"/v1/categories/{category['id']}")
+
+    result = client.post("/v1/import?format=csv", content=exported).json()
+
+    assert (result["error_count"], result["categories_created"], result["tasks_created"]) == (0, 1, 1)
+    [imported] = client.get("/v1/board").json()["categories"]
+    assert [(task["title"], task["description"]) for task in imported["tasks"]] == [("blank", "")]
+
+
+def test_errors_name_the_offending_field(client):
+    body = ndjson(
+        {"type": "category", "id": 1, "name": "c", "category_order": "first"},
+        {"type": "task", "title": "t", "description": "d", "task_order": 1},
+    )
+
+    errors = client.post("/v1/import", content=body).json()["errors"]
+
+    assert errors[0]["line"] == 1 and errors[0]["detail"].startswith("category_order: ")
+    assert errors[1] == {"line": 2, "detail": "category_id: Field required"}
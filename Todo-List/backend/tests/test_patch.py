@@ -0,0 +1,70 @@
+import pytest
+
+from app.core.versioning import board_version
+
+
+@pytest.fixture
+def task(client, reseed):
+    category_id, _ = reseed(2, 1)
+    return client.get(f"/v1/categories/{category_id}").json()["tasks"][0]
+
+
+@pytest.mark.parametrize("body", [{}, {"title": None}, "current"])
+def test_patch_that_changes_nothing_writes_nothing(client, task, published, body):
+    if body == "current":
+        body = {"title": task["title"], "task_order": task["task_order"]}
+    version = board_version.version
+
+    response = client.patch(f"/v1/tasks/{task['id']}", json=body)
+
+    assert response.status_code == 200
+    assert response.json() == task
+    assert (board_version.version, published) == (version, [])
+
+
+def test_patch_writes_only_the_fields_sent(client, task, published):
+    response = client.patch(f"/v1/tasks/{task['id']}", json={"title": "renamed", "description": None})
+
+    assert response.json() == {**task, "title": "renamed"}
+    assert client.get(f"/v1/tasks/{task['id']}").json() == {**task, "title": "renamed"}
+    assert published == ["task.updated"]
+
+
+def test_patch_moves_a_task_between_categories(client, task):
+    category_ids = [category["id"] for category in client.get("/v1/categories/summary").json()]
+    [target] = [category_id for category_id in category_ids if category_id != task["category_id"]]
+
+    assert client.patch(f"/v1/tasks/{task['id']}", json={"category_id": target}).json()["category_id"] == target
+    assert task["id"] in [t["id"] for t in client.get(f"/v1/categories/{target}").json()["tasks"]]
+    assert client.get(f"/v1/categories/{task['category_id']}").json()["tasks"] == []
+
+
+def test_patch_of_an_unknown_task_is_a_404(client, task):
+    response = client.patch("/v1/tasks/999999", json={"title": "x"})
+
+    assert (response.status_code, response.json()["detail"]) == (404, "Task not found")
+
+
+def test_patch_into_an_unknown_category_is_a_404_and_changes_nothing(client, task, published):
+    response = client.patch(f"/v1/tasks/{task['id']}", json={"title": "x", "category_id": 999999})
+
+    assert (response.status_code, response.json()["detail"]) == (404, "Category not found")
+    assert client.get(f"/v1/tasks/{task['id']}").json() == task
+    assert published == []
+
+
+def test_category_patch(client, reseed, published):
+    [category_id] = reseed(1, 1)
+    category = client.get(f"/v1/categories/{category_id}").json()
+    version = board_version.version
+
+    assert client.patch(f"/v1/categories/{category_id}", json={}).json() == category
+    assert client.patch(f"/v1/categories/{category_id}", json={"name": category["name"]}).json() == category
+    assert (board_version.version, published) == (version, [])
+
+    renamed = client.patch(f"/v1/categories/{category_id}", json={"name": "renamed"}).json()
+    assert renamed == {**category, "name": "renamed"}
+    assert published == ["category.updated"]
+
+    response = client.patch("/v1/categories/999999", json={"name": "x"})
+    assert (response.status_code, response.json()["detail"]) == (404, "Category not found")
@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.explain import RANKED_READS, check_plans
+from benchmarks.seed import seed
+from app.models import Task
+
+
+# SQLite never analyzes on its own, so a database may well run without statistics
+@pytest.mark.parametrize("analyze", [False, True], ids=["no-statistics", "analyzed"])
+def test_crud_reads_are_index_driven(engine, analyze):
+    category_ids = seed(engine, 50, 50)
+    with engine.begin() as connection:
+        # Statistics from an earlier test would outlive the rows they describe
+        connection.exec_driver_sql("DROP TABLE IF EXISTS sqlite_stat1")
+        if analyze:
+            connection.exec_driver_sql("ANALYZE")
+        task_id = connection.execute(Task.__table__.select().with_only_columns(Task.id).limit(1)).scalar()
+
+    results = check_plans(engine, category_ids[len(category_ids) // 2], task_id)
+
+    assert RANKED_READS <= {name for name, _, _, _ in results}
+    failures = [
+        f"{name}: {', '.join(problems)}\n  {' '.join(statement.split())}\n    " + "\n    ".join(plan)
+        for name, statement, plan, problems in results
+        if problems
+    ]
+    assert not failures, "\n".join(failures)
+
+
+def test_keyset_pages_seek_to_the_cursor(engine):
+    category_ids = seed(engine, 50, 50)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE IF EXISTS sqlite_stat1")
+        task_id = connection.execute(Task.__table__.select().with_only_columns(Task.id).limit(1)).scalar()
+
+    results = check_plans(engine, category_ids[len(category_ids) // 2], task_id)
+
+    # The page query itself, not the IN query that loads its tasks
+    pages = {
+        name: plan[0]
+        for name, statement, plan, _ in results
+        if name.startswith(("get_categories_page", "get_tasks_page")) and "category_id IN (" not in statement
+    }
+    assert len(pages) == 4
+    # A range on the order column, not just the equality prefix, or deep pages read every row before them
+    assert all("order>?" in line for line in pages.values()), pages
@@ -0,0 +1,74 @@
+import pytest
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    from app.core.cache import row_cache
+
+    keys = []
+    original = row_cache.invalidate
+    monkeypatch.setattr(row_cache, "invalidate", lambda *k: (keys.extend(k), original(*k)))
+    return keys
+
+
+def task_orders(client, category_id):
+    return [(task["id"], task["task_order"]) for task in client.get(f"/v1/categories/{category_id}/tasks/").json()["items"]]
+
+
+def move(client, task_id, category_id, after_id):
+    response = client.post("/v1/reorder", json={"tasks": [{"task_id": task_id, "category_id": category_id, "after_id": after_id}]})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_move_into_a_gap_leaves_siblings_alone(client, reseed, published):
+    [category_id] = reseed(1, 3)
+    (first, _), (second, second_order), (third, _) = task_orders(client, category_id)
+
+    move(client, third, category_id, first)
+
+    orders = task_orders(client, category_id)
+    assert [task_id for task_id, _ in orders] == [first, third, second]
+    assert dict(orders)[second] == second_order
+    assert published == ["task.moved"]
+
+
+def test_move_between_adjacent_keys_rebalances_the_column(client, reseed, published, invalidated):
+    [category_id] = reseed(1, 3, gap=1)
+    (first, _), (second, _), (third, _) = task_orders(client, category_id)
+
+    result = move(client, third, category_id, first)
+
+    orders = task_orders(client, category_id)
+    assert [task_id for task_id, _ in orders] == [first, third, second]
+    assert result["tasks"][0]["task_order"] == dict(orders)[third]
+    assert all(later - earlier > 1 for (_, earlier), (_, later) in zip(orders, orders[1:]))
+    assert published == ["task.moved", "board.changed"]
+    # Every renumbered sibling is invalidated, and nothing but real cache keys is passed
+    assert {("task", first), ("task", second), ("task", third)} <= set(invalidated)
+    assert all(kind in ("task", "category") and isinstance(id_, int) for kind, id_ in invalidated)
+
+
+def test_move_after_a_task_in_another_category_is_rejected(client, reseed):
+    first_category, second_category = reseed(2, 1)
+    [(task_id, _)] = task_orders(client, first_category)
+    [(other_id, _)] = task_orders(client, second_category)
+
+    response = client.post("/v1/reorder", json={"tasks": [{"task_id": task_id, "category_id": first_category, "after_id": other_id}]})
+
+    assert response.status_code == 404
+
+
+def test_unknown_task_rolls_back_earlier_moves_without_an_error_log(client, reseed, caplog):
+    [category_id] = reseed(1, 2)
+    before = task_orders(client, category_id)
+    (first, _), (second, _) = before
+
+    response = client.post("/v1/reorder", json={"tasks": [
+        {"task_id": first, "category_id": category_id, "after_id": second},
+        {"task_id": 999999, "category_id": category_id},
+    ]})
+
+    assert response.status_code == 404
+    assert task_orders(client, category_id) == before
+    assert not [record for record in caplog.records if "unexpected error" in record.getMessage()]
@@ -0,0 +1,62 @@
+from sqlalchemy import select
+
+from app.crud import CATEGORY_COLUMNS, TASK_COLUMNS
+from app.models import Category, Task
+
+
+def stored_task(engine, task_id):
+    with engine.connect() as connection:
+        row = connection.execute(select(*TASK_COLUMNS).where(Task.id == task_id)).first()
+    return row and dict(row._mapping)
+
+
+def stored_category(engine, category_id):
+    with engine.connect() as connection:
+        return dict(connection.execute(select(*CATEGORY_COLUMNS).where(Category.id == category_id)).one()._mapping)
+
+
+def test_task_writes_answer_with_the_stored_row(client, engine, reseed):
+    source, target = reseed(2, 1)
+
+    created = client.post(f"/v1/categories/{source}/tasks/",
+                          json={"title": "new", "description": "d", "task_order": 5}).json()
+    assert created == stored_task(engine, created["id"])
+    assert created["category_id"] == source
+
+    updated = client.put(f"/v1/tasks/{created['id']}",
+                         json={"title": "moved", "description": "e", "task_order": 7, "category_id": target}).json()
+    assert updated == stored_task(engine, created["id"])
+    assert (updated["title"], updated["category_id"]) == ("moved", target)
+
+    patched = client.patch(f"/v1/tasks/{created['id']}", json={"task_order": 3}).json()
+    assert patched == stored_task(engine, created["id"])
+    assert (patched["title"], patched["task_order"]) == ("moved", 3)
+
+    deleted = client.delete(f"/v1/tasks/{created['id']}").json()
+    assert (deleted["id"], deleted["category_id"]) == (created["id"], target)
+    assert stored_task(engine, created["id"]) is None
+
+
+def test_category_writes_answer_with_the_stored_row_and_its_tasks(client, engine, reseed):
+    [seeded] = reseed(1, 2)
+
+    created = client.post("/v1/categories/", json={"name": "new", "category_order": 1}).json()
+    assert created == {**stored_category(engine, created["id"]), "tasks": []}
+
+    updated = client.put(f"/v1/categories/{seeded}", json={"name": "renamed", "category_order": 9}).json()
+    assert {key: updated[key] for key in stored_category(engine, seeded)} == stored_category(engine, seeded)
+    assert updated["name"] == "renamed"
+    assert [task["title"] for task in updated["tasks"]] == [f"Task 0 of {seeded}", f"Task 1 of {seeded}"]
+
+
+def test_writes_to_a_missing_category_store_nothing(client, engine, reseed):
+    [category_id] = reseed(1, 1)
+    task = client.get(f"/v1/categories/{category_id}").json()["tasks"][0]
+
+    created = client.post("/v1/categories/999999/tasks/", json={"title": "x", "description": "d", "task_order": 1})
+    moved = client.put(f"/v1/tasks/{task['id']}", json={**task, "title": "x", "category_id": 999999})
+
+    assert (created.status_code, moved.status_code) == (404, 404)
+    assert moved.json()["detail"] == "Category not found"
+    assert stored_task(engine, task["id"]) == {key: task[key] for key in stored_task(engine, task["id"])}
+    assert len(client.get(f"/v1/categories/{category_id}").json()["tasks"]) == 1
@@ -0,0 +1,49 @@
+from app.core.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=30)
+    cache.set("key", "value")
+
+    now[0] += 29
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.peek("a"), cache.peek("b"), cache.peek("c")) == (1, None, 3)
+
+
+def test_moving_a_task_refreshes_both_categories(client, reseed):
+    source, target = reseed(2, 2)
+    task = client.get(f"/v1/categories/{source}").json()["tasks"][0]
+    assert len(client.get(f"/v1/categories/{target}").json()["tasks"]) == 2
+
+    response = client.put(f"/v1/tasks/{task['id']}", json={
+        "title": "moved", "description": task["description"], "task_order": task["task_order"], "category_id": target,
+    })
+    assert response.status_code == 200
+
+    assert task["id"] not in [t["id"] for t in client.get(f"/v1/categories/{source}").json()["tasks"]]
+    moved = [t for t in client.get(f"/v1/categories/{target}").json()["tasks"] if t["id"] == task["id"]]
+    assert [t["title"] for t in moved] == ["moved"]
+    assert client.get(f"/v1/tasks/{task['id']}").json()["category_id"] == target
+
+
+def test_renaming_a_category_refreshes_its_cached_copy(client, reseed):
+    [category_id] = reseed(1, 1)
+    assert client.get(f"/v1/categories/{category_id}").json()["name"] == "Category 0"
+
+    assert client.patch(f"/v1/categories/{category_id}", json={"name": "Renamed"}).status_code == 200
+
+    assert client.get(f"/v1/categories/{category_id}").json()["name"] == "Renamed"
@@ -0,0 +1,76 @@
+import pytest
+
+
+@pytest.fixture
+def tasks(client, reseed):
+    """Create tasks from ``{category index: [(title, description), ...]}``; returns their ids by title."""
+    def create(spec):
+        category_ids = reseed(len(spec), 0)
+        ids = {}
+        for index, rows in spec.items():
+            for order, (title, description) in enumerate(rows):
+                response = client.post(f"/v1/categories/{category_ids[index]}/tasks/",
+                                       json={"title": title, "description": description, "task_order": order})
+                ids[title] = response.json()["id"]
+        return category_ids, ids
+
+    return create
+
+
+def search(client, q, **params):
+    response = client.get("/v1/tasks/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_better_matches_rank_first(client, tasks):
+    _, ids = tasks({0: [
+        ("fruit", "one apple somewhere in a much longer description about other things entirely"),
+        ("apple", "apple pie"),
+        ("pear", "no match here"),
+    ]})
+
+    items = search(client, "apple")["items"]
+
+    assert [item["id"] for item in items] == [ids["apple"], ids["fruit"]]
+    assert items[0]["rank"] > items[1]["rank"]
+
+
+def test_every_term_must_match_and_the_last_one_is_a_prefix(client, tasks):
+    _, ids = tasks({0: [("red apple", "d"), ("green apple", "d"), ("red pepper", "d")]})
+
+    assert [item["id"] for item in search(client, "red app")["items"]] == [ids["red apple"]]
+
+
+def test_pages_follow_next_offset_without_gaps(client, tasks):
+    _, ids = tasks({0: [(f"match {i}", "d") for i in range(5)]})
+
+    seen, offset = [], 0
+    while offset is not None:
+        page = search(client, "match", limit=2, offset=offset)
+        assert len(page["items"]) <= 2
+        seen += [item["id"] for item in page["items"]]
+        offset = page["next_offset"]
+
+    assert sorted(seen) == sorted(ids.values())
+
+
+def test_category_filter(client, tasks):
+    category_ids, ids = tasks({0: [("shared one", "d")], 1: [("shared two", "d")]})
+
+    items = search(client, "shared", category_id=category_ids[1])["items"]
+
+    assert [item["id"] for item in items] == [ids["shared two"]]
+
+
+@pytest.mark.parametrize("q", ['"', 'apple"', "apple AND", "OR pie", "*", "-apple", "NEAR(apple pie)", "title:apple", "^"])
+def test_operators_in_the_query_are_matched_as_text(client, tasks, q):
+    tasks({0: [("apple", "pie")]})
+
+    assert search(client, q)["next_offset"] is None
+
+
+def test_blank_query_matches_nothing(client, tasks):
+    tasks({0: [("apple", "pie")]})
+
+    assert search(client, "   ") == {"items": [], "next_offset": None}
@@ -0,0 +1,27 @@
+from app.core import versioning
+
+
+def test_last_modified_is_withheld_until_its_second_is_over(client, monkeypatch):
+    clock = [1_000_000.2]
+    monkeypatch.setattr(versioning.time, "time", lambda: clock[0])
+    versioning.board_version.bump()
+
+    response = client.get("/v1/board")
+    assert "Last-Modified" not in response.headers
+    # Without a date of its own, If-Modified-Since cannot vouch for the client's copy
+    assert client.get("/v1/board", headers={"If-Modified-Since": "Mon, 12 Jan 1970 13:46:40 GMT"}).status_code == 200
+
+    clock[0] += 1
+    last_modified = client.get("/v1/board").headers["Last-Modified"]
+    assert client.get("/v1/board", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    # A write in a later second is newer than any date already handed out
+    versioning.board_version.bump()
+    assert client.get("/v1/board", headers={"If-Modified-Since": last_modified}).status_code == 200
+
+
+def test_etag_answers_before_last_modified_is_sent(client):
+    versioning.board_version.bump()
+    etag = client.get("/v1/board").headers["ETag"]
+
+    assert client.get("/v1/board", headers={"If-None-Match": etag}).status_code == 304